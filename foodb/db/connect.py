@@ -10,12 +10,23 @@ def connect(
     database_url_env: str = "DATABASE_URL",
     connect_timeout_s: int = 10,
     application_name: str = "foodb",
+    keepalives_idle_s: int = 30,
+    keepalives_interval_s: int = 10,
+    tcp_user_timeout_ms: int = 30_000,
+    prepare_threshold: int | None = 5,
 ) -> psycopg.Connection:
     database_url = os.environ.get(database_url_env)
     if not database_url:
         raise SystemExit(f"{database_url_env} is not set")
+    # TCP keepalives (and a user timeout for unacknowledged sends) so a long COPY run over
+    # a WAN notices a dead peer instead of hanging on a silently dropped connection.
     return psycopg.connect(
         database_url,
         connect_timeout=connect_timeout_s,
         application_name=application_name,
+        keepalives=1,
+        keepalives_idle=keepalives_idle_s,
+        keepalives_interval=keepalives_interval_s,
+        tcp_user_timeout=tcp_user_timeout_ms,
+        prepare_threshold=prepare_threshold,
     )
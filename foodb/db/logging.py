@@ -1,17 +1,22 @@
 from __future__ import annotations
 
 import json
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TextIO
 
 
 class Logger:
+    _RESERVED = frozenset({"ts", "event"})
+
     def __init__(self, *, fmt: str = "text", log_file: Path | None = None) -> None:
         if fmt not in {"text", "jsonl"}:
             raise ValueError("fmt must be 'text' or 'jsonl'")
         self._fmt = fmt
         self._fh: TextIO | None = None
+        self._ts_second = -1
+        self._ts = ""
         if log_file is not None:
             log_file.parent.mkdir(parents=True, exist_ok=True)
             self._fh = log_file.open("a", encoding="utf-8", errors="strict")
@@ -21,17 +26,23 @@ class Logger:
             self._fh.close()
             self._fh = None
 
+    def _timestamp(self) -> str:
+        # Timestamps have second resolution, so the formatted string is reused within a second.
+        now = int(time.time())
+        if now != self._ts_second:
+            self._ts_second = now
+            self._ts = datetime.fromtimestamp(now, UTC).isoformat(timespec="seconds")
+        return self._ts
+
     def event(self, name: str, **fields: object) -> None:
-        payload = {
-            "ts": datetime.now(UTC).isoformat(timespec="seconds"),
-            "event": name,
-            **fields,
-        }
+        ts = self._timestamp()
         if self._fmt == "jsonl":
-            line = json.dumps(payload, ensure_ascii=False)
+            # Always the stdlib encoder: log bytes must not depend on which optional packages
+            # are installed (orjson differs on spacing, NaN, float exponents and big ints).
+            line = json.dumps({"ts": ts, "event": name, **fields}, ensure_ascii=False)
         else:
-            kv = " ".join(f"{k}={payload[k]}" for k in payload if k not in {"ts", "event"})
-            line = f"[{payload['ts']}] {name}" + (f" {kv}" if kv else "")
+            kv = " ".join(f"{k}={v}" for k, v in fields.items() if k not in self._RESERVED)
+            line = f"[{ts}] {name}" + (f" {kv}" if kv else "")
 
         print(line, flush=True)
         if self._fh is not None:
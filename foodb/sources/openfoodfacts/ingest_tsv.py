@@ -2,28 +2,47 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
 import gzip
 import hashlib
 import io
 import json
+import multiprocessing
+import operator
+import os
 import random
+import re
 import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
+from typing import BinaryIO, TextIO
 
 import psycopg
 from psycopg import sql
 
 from foodb.db.connect import connect
 from foodb.db.logging import Logger
-from foodb.normalize.barcode import normalize_barcode
+from foodb.normalize.barcode import normalize_barcode_fast
 from foodb.sources.openfoodfacts.indexes import ddl as index_ddl
 from foodb.sources.openfoodfacts.nutrients import (
     minimal_nutrients,
     normalize_nutrient_key_from_field,
     unit_for_source_field,
 )
+from foodb.sources.openfoodfacts.ranges import data_ranges, read_range
 from foodb.sources.openfoodfacts.schema import ddl as schema_ddl
 
+try:
+    # Optional: ISA-L inflate (python-isal) is several times faster than zlib on the ~GB
+    # OFF export; it is a drop-in for the gzip module's GzipFile.
+    from isal import igzip as _gzip
+except ImportError:
+    _gzip = gzip
+
 
 def _detect_delimiter(header_line: str) -> str:
     tabs = header_line.count("\t")
@@ -33,6 +52,9 @@ def _detect_delimiter(header_line: str) -> str:
     return "\t"
 
 
+# OFF nutrient cells repeat heavily ("0", "0.5", "100", ...), so validating each distinct
+# string once turns the per-cell float() / ValueError path into a C-level cache hit.
+@functools.lru_cache(maxsize=1 << 16)
 def _float_or_empty(value: str) -> str:
     value = value.strip()
     if value == "":
@@ -53,17 +75,28 @@ def _int_or_empty(value: str) -> str:
     return ""
 
 
+# Single-codepoint -> escape-sequence map for COPY TEXT ("\x00" is dropped: Postgres text
+# can't hold NUL).
+_COPY_ESCAPE = str.maketrans(
+    {
+        "\x00": "",
+        "\\": "\\\\",
+        "\t": "\\t",
+        "\n": "\\n",
+        "\r": "\\r",
+        "\b": "\\b",
+        "\f": "\\f",
+        "\v": "\\v",
+    }
+)
+_COPY_NEEDS_ESCAPE = re.compile("[" + re.escape("".join(map(chr, _COPY_ESCAPE))) + "]")
+
+
 def _escape_copy_text(value: str) -> str:
-    return (
-        value.replace("\x00", "")
-        .replace("\\", "\\\\")
-        .replace("\t", "\\t")
-        .replace("\n", "\\n")
-        .replace("\r", "\\r")
-        .replace("\b", "\\b")
-        .replace("\f", "\\f")
-        .replace("\v", "\\v")
-    )
+    # Nearly every OFF cell is clean: one C-level scan and no allocation for those.
+    if _COPY_NEEDS_ESCAPE.search(value) is None:
+        return value
+    return value.translate(_COPY_ESCAPE)
 
 
 def _copy_cell(value: str, *, null_if_empty: bool) -> str:
@@ -72,12 +105,66 @@ def _copy_cell(value: str, *, null_if_empty: bool) -> str:
     return _escape_copy_text(value)
 
 
+# Text COPY lines are joined into pieces of this many rows per copy.write() call.
+_COPY_WRITE_ROWS = 1000
+
+
+def _copy_text_lines(rows: list[Sequence[str]], types: Sequence[str]) -> Iterator[str]:
+    null_if_empty = [t != "text" for t in types]
+    for row in rows:
+        yield (
+            "\t".join(
+                _copy_cell(v, null_if_empty=n) for v, n in zip(row, null_if_empty, strict=True)
+            )
+            + "\n"
+        )
+
+
+_BINARY_CONVERTERS: dict[str, Callable[[str], object]] = {
+    "text": lambda v: v.replace("\x00", ""),
+    "int8": lambda v: int(v) if v else None,
+    "float8": lambda v: float(v) if v else None,
+}
+
+
+def _copy_binary_rows(
+    rows: list[Sequence[str]], types: Sequence[str]
+) -> Iterator[tuple[object, ...]]:
+    converters = [_BINARY_CONVERTERS[t] for t in types]
+    for row in rows:
+        yield tuple(c(v) for c, v in zip(converters, row, strict=True))
+
+
+# Large sequential reads keep syscall count low on multi-GB exports.
+_READ_BUFFER_BYTES = 4 * 1024 * 1024
+
+
+def _advise_sequential(f: BinaryIO) -> None:
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
+@contextmanager
+def _open_input(path: Path, *, encoding_errors: str) -> Iterator[TextIO]:
+    # utf-8-sig drops a single leading BOM in the decoder, so the header needs no cleanup.
+    with path.open("rb", buffering=_READ_BUFFER_BYTES) as raw:
+        _advise_sequential(raw)
+        if path.suffix == ".gz":
+            with _gzip.GzipFile(fileobj=raw, mode="rb") as gz:
+                with io.TextIOWrapper(
+                    gz, encoding="utf-8-sig", errors=encoding_errors, newline=""
+                ) as f:
+                    yield f
+        else:
+            with io.TextIOWrapper(
+                raw, encoding="utf-8-sig", errors=encoding_errors, newline=""
+            ) as f:
+                yield f
+
+
 def _sha256(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
+    with path.open("rb", buffering=0) as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def _load_preflight_manifest(path: Path) -> dict[str, object]:
@@ -115,15 +202,460 @@ def _manifest_bool(data: dict[str, object], key: str) -> bool | None:
     raise SystemExit(f"Invalid preflight manifest field {key!r} (expected bool)")
 
 
-def _load_duplicate_codes(path: Path) -> set[str]:
+def _seen_key(code_norm: str) -> int | str:
+    # ASCII digit codes are kept as ints (~half the memory of a str in a multi-million
+    # entry set); the leading "1" keeps zero-padded codes like "0012345" and "12345" apart.
+    if code_norm.isascii():
+        return int("1" + code_norm)
+    return code_norm
+
+
+def _load_duplicate_codes(path: Path) -> frozenset[str]:
     try:
         with path.open("r", encoding="utf-8", errors="strict") as f:
-            codes = {line.strip() for line in f if line.strip()}
+            codes = frozenset(code for line in f if (code := line.strip()))
     except FileNotFoundError:
         raise SystemExit(f"Missing duplicate codes file: {path}") from None
     return codes
 
 
+_PRODUCT_COLS = (
+    "code_norm",
+    "code_raw",
+    "product_name",
+    "brands",
+    "categories",
+    "quantity",
+    "serving_size",
+    "last_modified_t",
+    "energy_kcal_100g",
+    "energy_kj_100g",
+    "fat_100g",
+    "saturated_fat_100g",
+    "carbohydrates_100g",
+    "sugars_100g",
+    "fiber_100g",
+    "protein_100g",
+    "sodium_100g",
+    "salt_100g",
+)
+# COPY column types; also decides which empty cells are NULL in TEXT format.
+_PRODUCT_TYPES = ["text"] * 7 + ["int8"] + ["float8"] * 10
+_NUTRIENT_TYPES = ["text", "text", "float8", "text", "text"]
+
+_PRODUCT_NUTRIENT_COLS = {
+    "energy-kcal_100g": "energy_kcal_100g",
+    "energy-kj_100g": "energy_kj_100g",
+    "energy_100g": "energy_kj_100g",
+    "fat_100g": "fat_100g",
+    "saturated-fat_100g": "saturated_fat_100g",
+    "carbohydrates_100g": "carbohydrates_100g",
+    "sugars_100g": "sugars_100g",
+    "fiber_100g": "fiber_100g",
+    "proteins_100g": "protein_100g",
+    "sodium_100g": "sodium_100g",
+    "salt_100g": "salt_100g",
+}
+
+# Product rows are plain lists in _PRODUCT_COLS order; these are the fixed slot positions.
+_PRODUCT_COL_INDEX = {c: i for i, c in enumerate(_PRODUCT_COLS)}
+_LAST_MODIFIED_T_I = _PRODUCT_COL_INDEX["last_modified_t"]
+_PRODUCT_SCORE_COLS = (
+    "product_name",
+    "brands",
+    "categories",
+    "quantity",
+    "serving_size",
+    "last_modified_t",
+)
+# Fetches the scored product slots in one C-level call; their empty count is then a
+# tuple.count("") instead of a generator over the indices.
+_product_score_fields = operator.itemgetter(*(_PRODUCT_COL_INDEX[c] for c in _PRODUCT_SCORE_COLS))
+
+_DuplicateBest = dict[str, tuple[tuple[int, int, int], list[str], list[tuple[str, ...]]]]
+
+
+@dataclass(frozen=True)
+class _RowPlan:
+    # Rows are normalized to the header width plus one trailing "" cell, so every
+    # column (including ones absent from the header) is a plain positional index.
+    width: int
+    code_i: int
+    product_name_i: int
+    brands_i: int
+    categories_i: int
+    quantity_i: int
+    serving_size_i: int
+    last_modified_t_i: int
+    energy_kj_i: int
+    # One entry per extracted nutrient column, resolved once from the header:
+    # (src_i, nutrient_key, unit, source_field, product_slot, energy_fallback, skip_if_kj).
+    # energy_fallback: energy_100g only fills energy_kj_100g if energy-kj_100g didn't;
+    # skip_if_kj: in minimal mode energy_100g isn't emitted when energy-kj_100g is present.
+    nutrient_plan: list[tuple[int, str, str, str, int | None, bool, bool]]
+
+
+def _row_plan(headers: list[str], *, nutrients: str, include_salt: bool) -> _RowPlan:
+    header_to_index = {h: i for i, h in enumerate(headers)}
+    width = len(headers)
+
+    def column_index(name: str) -> int:
+        return header_to_index.get(name, width)
+
+    minimal = nutrients == "minimal"
+    if minimal:
+        specs = minimal_nutrients(include_salt=include_salt)
+        fields = [(s.source_field, s.nutrient_key, s.unit) for s in specs]
+    else:
+        fields = [
+            (h, normalize_nutrient_key_from_field(h), unit_for_source_field(h))
+            for h in headers
+            if h.endswith("_100g")
+        ]
+
+    # Nutrient fields missing from the header can never produce a value.
+    nutrient_plan = [
+        (
+            header_to_index[source_field],
+            nutrient_key,
+            unit,
+            source_field,
+            _PRODUCT_COL_INDEX[_PRODUCT_NUTRIENT_COLS[source_field]]
+            if source_field in _PRODUCT_NUTRIENT_COLS
+            else None,
+            source_field == "energy_100g",
+            minimal and source_field == "energy_100g",
+        )
+        for source_field, nutrient_key, unit in fields
+        if source_field in header_to_index
+    ]
+
+    return _RowPlan(
+        width=width,
+        code_i=column_index("code"),
+        product_name_i=column_index("product_name"),
+        brands_i=column_index("brands"),
+        categories_i=column_index("categories"),
+        quantity_i=column_index("quantity"),
+        serving_size_i=column_index("serving_size"),
+        last_modified_t_i=column_index("last_modified_t"),
+        energy_kj_i=column_index("energy-kj_100g"),
+        nutrient_plan=nutrient_plan,
+    )
+
+
+class _ChunkWriter:
+    # Chunks are committed on a background thread so parsing the next chunk overlaps the
+    # previous chunk's COPY + commit; at most one chunk is in flight, so the connection is
+    # never shared by two COPYs and the caller's own statements wait for finish().
+    def __init__(
+        self,
+        conn: psycopg.Connection,
+        cur: psycopg.Cursor,
+        args: argparse.Namespace,
+        logger: Logger,
+    ) -> None:
+        self._conn = conn
+        self._cur = cur
+        self._logger = logger
+        self._chunk_rows = args.chunk_rows
+        self._retries = args.retries
+        self._retry_sleep_s = args.retry_sleep_s
+        self._binary = args.copy_format == "binary"
+        copy_options = sql.SQL(" WITH (FORMAT BINARY)" if self._binary else "")
+        self._copy_product = sql.SQL("COPY {}.product_raw ({}) FROM STDIN{}").format(
+            sql.Identifier(args.schema),
+            sql.SQL(", ").join(sql.Identifier(c) for c in _PRODUCT_COLS),
+            copy_options,
+        )
+        self._copy_nutrient = sql.SQL(
+            "COPY {}.nutrient_100g (code_norm, nutrient_key, value, unit, source_field) FROM STDIN{}"
+        ).format(sql.Identifier(args.schema), copy_options)
+        self._product_rows: list[Sequence[str]] = []
+        self._nutrient_rows: list[Sequence[str]] = []
+        self._rows_in_chunk = 0
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="off-copy")
+        self._pending: Future[None] | None = None
+        self.products = 0
+        self.nutrients = 0
+
+    def __enter__(self) -> _ChunkWriter:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._executor.shutdown(wait=True)
+
+    def add(self, product_values: list[str], row_nutrients: list[tuple[str, ...]]) -> None:
+        self._product_rows.append(product_values)
+        self._nutrient_rows.extend(row_nutrients)
+        self.products += 1
+        self.nutrients += len(row_nutrients)
+        self._rows_in_chunk += 1
+        if self._rows_in_chunk >= self._chunk_rows:
+            self.flush()
+
+    def add_batch(
+        self, product_rows: list[list[str]], nutrient_rows: list[tuple[str, ...]]
+    ) -> None:
+        # Commits the batch as one chunk; callers size batches to at most --chunk-rows.
+        self._product_rows.extend(product_rows)
+        self._nutrient_rows.extend(nutrient_rows)
+        self.products += len(product_rows)
+        self.nutrients += len(nutrient_rows)
+        self._rows_in_chunk += len(product_rows)
+        self.flush()
+
+    def flush(self) -> None:
+        if not self._rows_in_chunk:
+            return
+        self._wait()
+        self._pending = self._executor.submit(
+            self._commit_chunk, self._product_rows, self._nutrient_rows, self._rows_in_chunk
+        )
+        self._product_rows = []
+        self._nutrient_rows = []
+        self._rows_in_chunk = 0
+
+    def finish(self) -> None:
+        self.flush()
+        self._wait()
+
+    def _wait(self) -> None:
+        # Surfaces a failed chunk's exception in the caller's thread.
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            pending.result()
+
+    def _commit_chunk(
+        self,
+        product_rows: list[Sequence[str]],
+        nutrient_rows: list[Sequence[str]],
+        rows_products: int,
+    ) -> None:
+        self._flush(
+            product_rows, self._copy_product, _PRODUCT_TYPES, rows_products, kind="product_raw"
+        )
+        self._flush(
+            nutrient_rows, self._copy_nutrient, _NUTRIENT_TYPES, rows_products, kind="nutrient_100g"
+        )
+
+    def _flush(
+        self,
+        rows: list[Sequence[str]],
+        stmt: sql.Composed,
+        types: list[str],
+        rows_products: int,
+        *,
+        kind: str,
+    ) -> None:
+        if not rows:
+            return
+        self._copy_with_retry(stmt, rows, types, rows_products, kind=kind)
+        self._logger.event("chunk_commit", kind=kind, rows_products=rows_products)
+
+    def _copy_with_retry(
+        self,
+        stmt: sql.Composed,
+        rows: list[Sequence[str]],
+        types: list[str],
+        rows_products: int,
+        *,
+        kind: str,
+    ) -> None:
+        for attempt in range(self._retries + 1):
+            try:
+                # Rows are encoded as they are written, so psycopg can send
+                # buffered data while the rest of the chunk is still encoding.
+                with self._cur.copy(stmt) as copy:
+                    if self._binary:
+                        copy.set_types(types)
+                        for row in _copy_binary_rows(rows, types):
+                            copy.write_row(row)
+                    else:
+                        # One write per batch of lines, not per row: each write is a trip
+                        # through psycopg's formatter and libpq.
+                        lines = _copy_text_lines(rows, types)
+                        while piece := "".join(islice(lines, _COPY_WRITE_ROWS)):
+                            copy.write(piece)
+                self._conn.commit()
+                return
+            except psycopg.errors.SerializationFailure as e:
+                self._conn.rollback()
+                if attempt >= self._retries:
+                    raise
+                sleep_s = min(self._retry_sleep_s * (2**attempt), 10.0) + random.random() * 0.05
+                self._logger.event(
+                    "retry",
+                    kind=kind,
+                    rows_products=rows_products,
+                    attempt=attempt + 1,
+                    sleep_s=round(sleep_s, 3),
+                    error_type=type(e).__name__,
+                )
+                time.sleep(sleep_s)
+            except Exception:
+                self._conn.rollback()
+                raise
+
+
+def _ingest_rows(
+    reader: Iterator[list[str]],
+    plan: _RowPlan,
+    writer: _ChunkWriter,
+    *,
+    max_rows: int,
+    seen_codes: set[int | str] | None,
+    duplicate_codes: frozenset[str],
+    duplicate_best: _DuplicateBest,
+) -> tuple[int, int]:
+    skipped_no_code = 0
+    skipped_duplicate_code = 0
+
+    width = plan.width
+    pad = [""] * width
+    code_i = plan.code_i
+    product_fields = operator.itemgetter(
+        plan.product_name_i,
+        plan.brands_i,
+        plan.categories_i,
+        plan.quantity_i,
+        plan.serving_size_i,
+        plan.last_modified_t_i,
+    )
+    energy_kj_i = plan.energy_kj_i
+    nutrient_plan = plan.nutrient_plan
+
+    for row in reader:
+        if max_rows and writer.products >= max_rows:
+            break
+
+        if len(row) != width:
+            row = row[:width] if len(row) > width else row + pad[len(row) :]
+        row.append("")
+
+        raw_code = row[code_i]
+        code_norm = normalize_barcode_fast(raw_code)
+        if code_norm == "":
+            skipped_no_code += 1
+            continue
+        if seen_codes is not None:
+            seen_key = _seen_key(code_norm)
+            if seen_key in seen_codes:
+                skipped_duplicate_code += 1
+                continue
+            seen_codes.add(seen_key)
+
+        # Each text field is fetched and stripped exactly once, and only for rows that
+        # survive the code checks; last_modified_t is stripped by _int_or_empty.
+        product_name, brands, categories, quantity, serving_size, last_modified_t = product_fields(
+            row
+        )
+        # Slots follow _PRODUCT_COLS; the ten nutrient columns start empty.
+        base = [
+            code_norm,
+            raw_code.strip(),
+            product_name.strip(),
+            brands.strip(),
+            categories.strip(),
+            quantity.strip(),
+            serving_size.strip(),
+            _int_or_empty(last_modified_t),
+            "",
+            "",
+            "",
+            "",
+            "",
+            "",
+            "",
+            "",
+            "",
+            "",
+        ]
+
+        row_nutrients: list[tuple[str, ...]] = []
+        nutrient_count = 0
+
+        for src_i, nk, unit, source_field, col, energy_fallback, skip_if_kj in nutrient_plan:
+            val = row[src_i]
+            if val == "":
+                continue
+            cleaned = _float_or_empty(val)
+            if cleaned == "":
+                continue
+
+            if col is not None and not (energy_fallback and base[col] != ""):
+                base[col] = cleaned
+
+            if skip_if_kj and row[energy_kj_i]:
+                continue
+
+            row_nutrients.append((code_norm, nk, cleaned, unit, source_field))
+            nutrient_count += 1
+
+        if code_norm in duplicate_codes:
+            last_modified = int(base[_LAST_MODIFIED_T_I]) if base[_LAST_MODIFIED_T_I] else -1
+            product_nonempty = len(_PRODUCT_SCORE_COLS) - _product_score_fields(base).count("")
+            score = (last_modified, nutrient_count, product_nonempty)
+            existing = duplicate_best.get(code_norm)
+            if existing is not None and score <= existing[0]:
+                continue
+            duplicate_best[code_norm] = (score, base, row_nutrients)
+            continue
+
+        writer.add(base, row_nutrients)
+
+    return skipped_no_code, skipped_duplicate_code
+
+
+_worker_duplicate_codes: frozenset[str] = frozenset()
+
+
+def _init_worker(duplicate_codes: frozenset[str]) -> None:
+    # Shipped once per worker process instead of once per task.
+    global _worker_duplicate_codes
+    _worker_duplicate_codes = duplicate_codes
+
+
+def _ingest_range(
+    task: tuple[argparse.Namespace, list[str], str, int, int],
+) -> tuple[dict[str, int], _DuplicateBest]:
+    args, headers, delimiter, start, end = task
+    logger = Logger(fmt=args.log_format, log_file=args.log_file)
+    try:
+        plan = _row_plan(headers, nutrients=args.nutrients, include_salt=args.include_salt)
+        duplicate_best: _DuplicateBest = {}
+        with connect(
+            database_url_env=args.database_url_env,
+            application_name="foodb-openfoodfacts-import",
+            prepare_threshold=None,
+        ) as conn:
+            with conn.cursor() as cur:
+                with _ChunkWriter(conn, cur, args, logger) as writer:
+                    reader = csv.reader(
+                        read_range(args.tsv_path, start, end, encoding_errors=args.encoding_errors),
+                        delimiter=delimiter,
+                    )
+                    skipped_no_code, skipped_duplicate_code = _ingest_rows(
+                        reader,
+                        plan,
+                        writer,
+                        max_rows=0,
+                        seen_codes=None,
+                        duplicate_codes=_worker_duplicate_codes,
+                        duplicate_best=duplicate_best,
+                    )
+                    writer.finish()
+        counts = {
+            "products": writer.products,
+            "nutrients": writer.nutrients,
+            "skipped_no_code": skipped_no_code,
+            "skipped_duplicate_code": skipped_duplicate_code,
+        }
+        return counts, duplicate_best
+    finally:
+        logger.close()
+
+
 def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Import OpenFoodFacts TSV/CSV export into CockroachDB."
@@ -206,12 +738,24 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="Skip secondary index creation (primary key still enforced).",
     )
+    parser.add_argument(
+        "--copy-format",
+        choices=["text", "binary"],
+        default="text",
+        help="COPY wire format: text (escaped) or binary (typed values, no client-side escaping).",
+    )
     parser.add_argument(
         "--dedupe",
         choices=["none", "memory"],
         default="none",
         help="Duplicate handling for code_norm: none (fast) or memory (skip duplicates).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Parse/COPY worker processes over byte ranges of an uncompressed input (default: 1).",
+    )
     parser.add_argument("--log-file", type=Path, default=None, help="Optional JSONL/text log file.")
     parser.add_argument(
         "--log-format", choices=["text", "jsonl"], default="text", help="Log output format."
@@ -289,8 +833,9 @@ def main(argv: list[str] | None = None) -> int:
                 duplicate_codes_path = (
                     args.preflight_manifest.parent / duplicate_codes_path
                 ).resolve()
+        # Empty when there is nothing to resolve, so the row loop tests membership unguarded.
         duplicate_codes = (
-            _load_duplicate_codes(duplicate_codes_path) if duplicate_codes_path else None
+            _load_duplicate_codes(duplicate_codes_path) if duplicate_codes_path else frozenset()
         )
 
         if manifest_duplicates and args.dedupe == "none" and not duplicate_codes:
@@ -298,21 +843,25 @@ def main(argv: list[str] | None = None) -> int:
                 "Preflight reported duplicates; pass --duplicate-codes from preflight (preferred) or use --dedupe memory."
             )
 
-        open_fn = gzip.open if args.tsv_path.suffix == ".gz" else open
-        with open_fn(
-            args.tsv_path,
-            "rt",
-            encoding="utf-8",
-            errors=args.encoding_errors,
-            newline="",
-        ) as f:
+        if args.workers < 1:
+            raise SystemExit("--workers must be >= 1")
+        if args.workers > 1:
+            if args.tsv_path.suffix == ".gz":
+                raise SystemExit(
+                    "--workers > 1 needs an uncompressed input (byte ranges can't be split in a gzip stream); decompress it first."
+                )
+            if args.dedupe == "memory":
+                raise SystemExit(
+                    "--dedupe memory is not supported with --workers > 1; pass --duplicate-codes from preflight."
+                )
+            if args.max_rows:
+                raise SystemExit("--max-rows is not supported with --workers > 1.")
+
+        with _open_input(args.tsv_path, encoding_errors=args.encoding_errors) as f:
             header_line = f.readline()
             if not header_line:
                 raise SystemExit(f"Empty file: {args.tsv_path}")
 
-            if header_line.startswith("\ufeff"):
-                header_line = header_line.lstrip("\ufeff")
-
             detected = _detect_delimiter(header_line)
             delimiter = args.delimiter
             if args.delimiter == "\t" and detected != "\t":
@@ -320,43 +869,35 @@ def main(argv: list[str] | None = None) -> int:
             logger.event("dialect", delimiter=repr(delimiter), detected=repr(detected))
 
             headers = next(csv.reader([header_line], delimiter=delimiter))
-            header_to_index = {h: i for i, h in enumerate(headers)}
-
-            def get(row: list[str], name: str) -> str:
-                idx = header_to_index.get(name)
-                if idx is None or idx >= len(row):
-                    return ""
-                return row[idx]
-
-            if "code" not in header_to_index:
+            if "code" not in headers:
                 raise SystemExit("Input is missing required column: code")
+            plan = _row_plan(headers, nutrients=args.nutrients, include_salt=args.include_salt)
+
+            # Each worker parses one line-aligned byte range and COPYs it over its own
+            # connection. The pool forks before the main connection opens so no worker
+            # inherits its socket; a header-only file has no ranges and takes the serial path.
+            tasks = []
+            if args.workers > 1:
+                tasks = [
+                    (args, headers, delimiter, start, end)
+                    for start, end in data_ranges(args.tsv_path, args.workers)
+                ]
+            pool_context = (
+                multiprocessing.get_context().Pool(
+                    len(tasks), initializer=_init_worker, initargs=(duplicate_codes,)
+                )
+                if tasks
+                else nullcontext()
+            )
 
-            if args.nutrients == "minimal":
-                specs = minimal_nutrients(include_salt=args.include_salt)
-                by_field = {s.source_field: (s.nutrient_key, s.unit) for s in specs}
-                nutrient_fields = [s.source_field for s in specs]
-            else:
-                by_field = {}
-                nutrient_fields = [h for h in headers if h.endswith("_100g")]
-
-            product_nutrient_cols = {
-                "energy-kcal_100g": "energy_kcal_100g",
-                "energy-kj_100g": "energy_kj_100g",
-                "energy_100g": "energy_kj_100g",
-                "fat_100g": "fat_100g",
-                "saturated-fat_100g": "saturated_fat_100g",
-                "carbohydrates_100g": "carbohydrates_100g",
-                "sugars_100g": "sugars_100g",
-                "fiber_100g": "fiber_100g",
-                "proteins_100g": "protein_100g",
-                "sodium_100g": "sodium_100g",
-                "salt_100g": "salt_100g",
-            }
-
-            with connect(
-                database_url_env=args.database_url_env,
-                application_name="foodb-openfoodfacts-import",
-            ) as conn:
+            with (
+                pool_context as pool,
+                connect(
+                    database_url_env=args.database_url_env,
+                    application_name="foodb-openfoodfacts-import",
+                    prepare_threshold=None,
+                ) as conn,
+            ):
                 with conn.cursor() as cur:
                     for stmt in schema_ddl(schema=args.schema):
                         cur.execute(stmt)
@@ -375,256 +916,54 @@ def main(argv: list[str] | None = None) -> int:
                         )
                         conn.commit()
 
-                    product_cols = [
-                        "code_norm",
-                        "code_raw",
-                        "product_name",
-                        "brands",
-                        "categories",
-                        "quantity",
-                        "serving_size",
-                        "last_modified_t",
-                        "energy_kcal_100g",
-                        "energy_kj_100g",
-                        "fat_100g",
-                        "saturated_fat_100g",
-                        "carbohydrates_100g",
-                        "sugars_100g",
-                        "fiber_100g",
-                        "protein_100g",
-                        "sodium_100g",
-                        "salt_100g",
-                    ]
-                    product_numeric_cols = {
-                        "last_modified_t",
-                        "energy_kcal_100g",
-                        "energy_kj_100g",
-                        "fat_100g",
-                        "saturated_fat_100g",
-                        "carbohydrates_100g",
-                        "sugars_100g",
-                        "fiber_100g",
-                        "protein_100g",
-                        "sodium_100g",
-                        "salt_100g",
-                    }
-                    copy_product = sql.SQL("COPY {}.product_raw ({}) FROM STDIN").format(
-                        sql.Identifier(args.schema),
-                        sql.SQL(", ").join(sql.Identifier(c) for c in product_cols),
-                    )
-                    copy_nutrient = sql.SQL(
-                        "COPY {}.nutrient_100g (code_norm, nutrient_key, value, unit, source_field) FROM STDIN"
-                    ).format(sql.Identifier(args.schema))
-
-                    def copy_with_retry(
-                        stmt: sql.SQL,
-                        data: str,
-                        *,
-                        kind: str,
-                        rows_products: int,
-                    ) -> None:
-                        for attempt in range(args.retries + 1):
-                            try:
-                                with cur.copy(stmt) as copy:
-                                    copy.write(data)
-                                conn.commit()
-                                return
-                            except psycopg.errors.SerializationFailure as e:
-                                conn.rollback()
-                                if attempt >= args.retries:
-                                    raise
-                                sleep_s = (
-                                    min(args.retry_sleep_s * (2**attempt), 10.0)
-                                    + random.random() * 0.05
-                                )
-                                logger.event(
-                                    "retry",
-                                    kind=kind,
-                                    rows_products=rows_products,
-                                    attempt=attempt + 1,
-                                    sleep_s=round(sleep_s, 3),
-                                    error_type=type(e).__name__,
-                                )
-                                time.sleep(sleep_s)
-                            except Exception:
-                                conn.rollback()
-                                raise
-
-                    def flush(
-                        buf: io.StringIO, stmt: sql.SQL, rows_products: int, *, kind: str
-                    ) -> io.StringIO:
-                        data = buf.getvalue()
-                        if not data:
-                            return buf
-                        copy_with_retry(stmt, data, kind=kind, rows_products=rows_products)
-                        logger.event("chunk_commit", kind=kind, rows_products=rows_products)
-                        return io.StringIO()
-
-                    product_buf = io.StringIO()
-                    nutrient_buf = io.StringIO()
-                    rows_in_chunk = 0
-                    products = 0
-                    nutrients = 0
-                    skipped_no_code = 0
-                    skipped_duplicate_code = 0
-                    seen_codes: set[str] | None = set() if args.dedupe == "memory" else None
-                    duplicate_best: dict[str, tuple[tuple[int, int, int], str, list[str]]] = {}
-                    duplicates_resolved = 0
-                    product_score_fields = (
-                        "product_name",
-                        "brands",
-                        "categories",
-                        "quantity",
-                        "serving_size",
-                        "last_modified_t",
-                    )
-
-                    t0 = time.time()
-                    reader = csv.reader(f, delimiter=delimiter)
-                    for _row_number, row in enumerate(reader, start=2):
-                        if args.max_rows and products >= args.max_rows:
-                            break
-
-                        raw_code = get(row, "code").strip()
-                        code_norm = normalize_barcode(raw_code).normalized
-                        if code_norm == "":
-                            skipped_no_code += 1
-                            continue
-                        if seen_codes is not None:
-                            if code_norm in seen_codes:
-                                skipped_duplicate_code += 1
-                                continue
-                            seen_codes.add(code_norm)
-
-                        base: dict[str, str] = {
-                            "code_norm": code_norm,
-                            "code_raw": raw_code,
-                            "product_name": get(row, "product_name").strip(),
-                            "brands": get(row, "brands").strip(),
-                            "categories": get(row, "categories").strip(),
-                            "quantity": get(row, "quantity").strip(),
-                            "serving_size": get(row, "serving_size").strip(),
-                            "last_modified_t": _int_or_empty(get(row, "last_modified_t")),
-                            "energy_kcal_100g": "",
-                            "energy_kj_100g": "",
-                            "fat_100g": "",
-                            "saturated_fat_100g": "",
-                            "carbohydrates_100g": "",
-                            "sugars_100g": "",
-                            "fiber_100g": "",
-                            "protein_100g": "",
-                            "sodium_100g": "",
-                            "salt_100g": "",
-                        }
-
-                        nutrient_lines: list[str] = []
-                        nutrient_count = 0
-
-                        for source_field in nutrient_fields:
-                            val = get(row, source_field)
-                            if val == "":
-                                continue
-                            cleaned = _float_or_empty(val)
-                            if cleaned == "":
-                                continue
-
-                            if args.nutrients == "minimal":
-                                nk, unit = by_field[source_field]
-                            else:
-                                nk = normalize_nutrient_key_from_field(source_field)
-                                unit = unit_for_source_field(source_field)
-
-                            col = product_nutrient_cols.get(source_field)
-                            if col is not None:
-                                if (
-                                    col == "energy_kj_100g"
-                                    and source_field == "energy_100g"
-                                    and base[col] != ""
-                                ):
-                                    pass
-                                else:
-                                    base[col] = cleaned
-
-                            if (
-                                args.nutrients == "minimal"
-                                and source_field == "energy_100g"
-                                and get(row, "energy-kj_100g")
-                            ):
-                                continue
-
-                            nutrient_lines.append(
-                                "\t".join(
-                                    _copy_cell(x, null_if_empty=False)
-                                    for x in (code_norm, nk, cleaned, unit, source_field)
-                                )
-                                + "\n"
-                            )
-                            nutrient_count += 1
-
-                        product_line = (
-                            "\t".join(
-                                _copy_cell(str(base[c]), null_if_empty=c in product_numeric_cols)
-                                for c in product_cols
-                            )
-                            + "\n"
+                    with _ChunkWriter(conn, cur, args, logger) as writer:
+                        products = 0
+                        nutrients = 0
+                        skipped_no_code = 0
+                        skipped_duplicate_code = 0
+                        seen_codes: set[int | str] | None = (
+                            set() if args.dedupe == "memory" else None
                         )
-
-                        if duplicate_codes and code_norm in duplicate_codes:
-                            last_modified = (
-                                int(base["last_modified_t"]) if base["last_modified_t"] else -1
+                        duplicate_best: _DuplicateBest = {}
+
+                        t0 = time.time()
+                        if pool is not None:
+                            # Duplicate candidates come back here so the winner is still chosen
+                            # across the whole file.
+                            results = pool.map(_ingest_range, tasks)
+                            for counts, worker_best in results:
+                                products += counts["products"]
+                                nutrients += counts["nutrients"]
+                                skipped_no_code += counts["skipped_no_code"]
+                                skipped_duplicate_code += counts["skipped_duplicate_code"]
+                                for code_norm, candidate in worker_best.items():
+                                    existing = duplicate_best.get(code_norm)
+                                    if existing is None or candidate[0] > existing[0]:
+                                        duplicate_best[code_norm] = candidate
+                        else:
+                            skipped_no_code, skipped_duplicate_code = _ingest_rows(
+                                csv.reader(f, delimiter=delimiter),
+                                plan,
+                                writer,
+                                max_rows=args.max_rows,
+                                seen_codes=seen_codes,
+                                duplicate_codes=duplicate_codes,
+                                duplicate_best=duplicate_best,
                             )
-                            product_nonempty = sum(1 for k in product_score_fields if base[k] != "")
-                            score = (last_modified, nutrient_count, product_nonempty)
-                            existing = duplicate_best.get(code_norm)
-                            if existing is None or score > existing[0]:
-                                duplicate_best[code_norm] = (score, product_line, nutrient_lines)
-                            continue
-
-                        product_buf.write(product_line)
-                        for line in nutrient_lines:
-                            nutrient_buf.write(line)
-                        products += 1
-                        nutrients += nutrient_count
-                        rows_in_chunk += 1
-
-                        if rows_in_chunk >= args.chunk_rows:
-                            product_buf = flush(
-                                product_buf, copy_product, rows_in_chunk, kind="product_raw"
-                            )
-                            nutrient_buf = flush(
-                                nutrient_buf, copy_nutrient, rows_in_chunk, kind="nutrient_100g"
+
+                        # Duplicate winners go out as whole chunks rather than row by row.
+                        writer.flush()
+                        winners = list(duplicate_best.values())
+                        for start in range(0, len(winners), args.chunk_rows):
+                            batch = winners[start : start + args.chunk_rows]
+                            writer.add_batch(
+                                [product_values for _score, product_values, _n in batch],
+                                [n for _score, _p, row_nutrients in batch for n in row_nutrients],
                             )
-                            rows_in_chunk = 0
-
-                    if duplicate_best:
-                        for _code_norm, (
-                            _score,
-                            product_line,
-                            nutrient_lines,
-                        ) in duplicate_best.items():
-                            product_buf.write(product_line)
-                            for line in nutrient_lines:
-                                nutrient_buf.write(line)
-                            products += 1
-                            nutrients += len(nutrient_lines)
-                            rows_in_chunk += 1
-                            duplicates_resolved += 1
-                            if rows_in_chunk >= args.chunk_rows:
-                                product_buf = flush(
-                                    product_buf, copy_product, rows_in_chunk, kind="product_raw"
-                                )
-                                nutrient_buf = flush(
-                                    nutrient_buf, copy_nutrient, rows_in_chunk, kind="nutrient_100g"
-                                )
-                                rows_in_chunk = 0
-
-                    if rows_in_chunk:
-                        product_buf = flush(
-                            product_buf, copy_product, rows_in_chunk, kind="product_raw"
-                        )
-                        nutrient_buf = flush(
-                            nutrient_buf, copy_nutrient, rows_in_chunk, kind="nutrient_100g"
-                        )
+                        duplicates_resolved = len(winners)
+                        writer.finish()
+                    products += writer.products
+                    nutrients += writer.nutrients
 
                     cur.execute(
                         sql.SQL(
@@ -3,30 +3,41 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NutrientSpec:
     source_field: str
     nutrient_key: str
     unit: str
 
 
-def minimal_nutrients(*, include_salt: bool) -> list[NutrientSpec]:
-    specs = [
-        NutrientSpec(source_field="energy-kcal_100g", nutrient_key="energy_kcal", unit="kcal"),
-        NutrientSpec(source_field="energy-kj_100g", nutrient_key="energy_kj", unit="kJ"),
-        # Some exports may only have energy_100g; OFF docs describe energy in kJ for _100g.
-        NutrientSpec(source_field="energy_100g", nutrient_key="energy_kj", unit="kJ"),
-        NutrientSpec(source_field="fat_100g", nutrient_key="fat", unit="g"),
-        NutrientSpec(source_field="saturated-fat_100g", nutrient_key="saturated_fat", unit="g"),
-        NutrientSpec(source_field="carbohydrates_100g", nutrient_key="carbohydrates", unit="g"),
-        NutrientSpec(source_field="sugars_100g", nutrient_key="sugars", unit="g"),
-        NutrientSpec(source_field="fiber_100g", nutrient_key="fiber", unit="g"),
-        NutrientSpec(source_field="proteins_100g", nutrient_key="protein", unit="g"),
-        NutrientSpec(source_field="sodium_100g", nutrient_key="sodium", unit="g"),
-    ]
-    if include_salt:
-        specs.append(NutrientSpec(source_field="salt_100g", nutrient_key="salt", unit="g"))
-    return specs
+_MINIMAL_NUTRIENTS = (
+    NutrientSpec(source_field="energy-kcal_100g", nutrient_key="energy_kcal", unit="kcal"),
+    NutrientSpec(source_field="energy-kj_100g", nutrient_key="energy_kj", unit="kJ"),
+    # Some exports may only have energy_100g; OFF docs describe energy in kJ for _100g.
+    NutrientSpec(source_field="energy_100g", nutrient_key="energy_kj", unit="kJ"),
+    NutrientSpec(source_field="fat_100g", nutrient_key="fat", unit="g"),
+    NutrientSpec(source_field="saturated-fat_100g", nutrient_key="saturated_fat", unit="g"),
+    NutrientSpec(source_field="carbohydrates_100g", nutrient_key="carbohydrates", unit="g"),
+    NutrientSpec(source_field="sugars_100g", nutrient_key="sugars", unit="g"),
+    NutrientSpec(source_field="fiber_100g", nutrient_key="fiber", unit="g"),
+    NutrientSpec(source_field="proteins_100g", nutrient_key="protein", unit="g"),
+    NutrientSpec(source_field="sodium_100g", nutrient_key="sodium", unit="g"),
+)
+_MINIMAL_NUTRIENTS_WITH_SALT = (
+    *_MINIMAL_NUTRIENTS,
+    NutrientSpec(source_field="salt_100g", nutrient_key="salt", unit="g"),
+)
+
+_SOURCE_FIELD_UNITS = {
+    "energy-kj_100g": "kJ",
+    "energy_100g": "kJ",
+    "energy-kcal_100g": "kcal",
+}
+
+
+def minimal_nutrients(*, include_salt: bool) -> tuple[NutrientSpec, ...]:
+    # The specs are immutable, so both variants are built once at import time.
+    return _MINIMAL_NUTRIENTS_WITH_SALT if include_salt else _MINIMAL_NUTRIENTS
 
 
 def normalize_nutrient_key_from_field(source_field: str) -> str:
@@ -38,8 +49,4 @@ def normalize_nutrient_key_from_field(source_field: str) -> str:
 
 
 def unit_for_source_field(source_field: str) -> str:
-    if source_field in {"energy-kj_100g", "energy_100g"}:
-        return "kJ"
-    if source_field == "energy-kcal_100g":
-        return "kcal"
-    return ""
+    return _SOURCE_FIELD_UNITS.get(source_field, "")
@@ -1,19 +1,44 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import csv
 import gzip
 import hashlib
+import heapq
+import io
 import json
+import multiprocessing
 import os
 import subprocess
 import tempfile
 import time
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+from itertools import groupby, islice
 from pathlib import Path
+from typing import BinaryIO, TextIO
 
+import psycopg
+from psycopg import sql
+
+from foodb.db.connect import connect
 from foodb.db.logging import Logger
-from foodb.normalize.barcode import normalize_barcode
+from foodb.normalize.barcode import normalize_barcode_fast, normalize_barcodes_fast
+from foodb.sources.openfoodfacts.ranges import data_ranges, read_range
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional: ISA-L inflate (python-isal), same drop-in GzipFile as the importer uses.
+    from isal import igzip as _gzip
+except ImportError:
+    _gzip = gzip
 
 
 def _detect_delimiter(header_line: str) -> str:
@@ -24,12 +49,180 @@ def _detect_delimiter(header_line: str) -> str:
     return "\t"
 
 
+class _HashingReader(io.RawIOBase):
+    # SHA-256 of the raw (still compressed) bytes, computed as the parser pulls them, so the
+    # input is read from disk once instead of once for the hash and once for the scan.
+    def __init__(self, raw: BinaryIO) -> None:
+        self._raw = raw
+        self._hash = hashlib.sha256()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: bytearray | memoryview) -> int:
+        n = self._raw.readinto(b)
+        if n:
+            self._hash.update(memoryview(b)[:n])
+        return n
+
+    def hexdigest(self) -> str:
+        # Hash whatever the decoders left unread (e.g. trailing bytes) before finishing.
+        while chunk := self._raw.read(1024 * 1024):
+            self._hash.update(chunk)
+        return self._hash.hexdigest()
+
+
+@contextlib.contextmanager
+def _open_hashed(path: Path, *, encoding_errors: str) -> Iterator[tuple[TextIO, _HashingReader]]:
+    with path.open("rb", buffering=0) as raw:
+        hashing = _HashingReader(raw)
+        buffered = io.BufferedReader(hashing, buffer_size=1024 * 1024)
+        binary: BinaryIO = (
+            _gzip.GzipFile(fileobj=buffered, mode="rb") if path.suffix == ".gz" else buffered
+        )
+        with io.TextIOWrapper(
+            binary, encoding="utf-8-sig", errors=encoding_errors, newline=""
+        ) as f:
+            yield f, hashing
+
+
+def _split_field(lines: Iterator[str], delimiter: str, index: int) -> Iterator[str]:
+    # Plain str.split with no quote handling (see --strict-csv); only the first index + 1
+    # delimiters are split, so the rest of the line is never tokenized.
+    maxsplit = index + 1
+    for line in lines:
+        fields = line.split(delimiter, maxsplit)
+        yield fields[index] if index < len(fields) else ""
+
+
 def _sha256(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
+    with path.open("rb", buffering=0) as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+# Codes normalized and counted per batch on the memory paths; the budget is checked per batch.
+_COUNT_BATCH_ROWS = 100_000
+
+
+def _count_range(
+    task: tuple[Path, int, int, str, int, str, int, Path | None],
+) -> tuple[Counter[str], list[Path], int, int]:
+    # Counts one byte range under its share of the memory budget. Past the share, counts go
+    # to sorted runs like the serial path's, and the residue joins them at the end so only
+    # run paths come back; otherwise the counts come back as they are. The parent never sees
+    # the runs of a failed range, so they are removed here.
+    path, start, end, delimiter, code_idx, encoding_errors, max_codes, tmp_dir = task
+    lines = read_range(path, start, end, encoding_errors=encoding_errors)
+    raw_codes = _split_field(lines, delimiter, code_idx)
+    code_counts: Counter[str] = Counter()
+    runs: list[Path] = []
+    codes_total = 0
+    skipped_no_code = 0
+    try:
+        while batch := list(islice(raw_codes, _COUNT_BATCH_ROWS)):
+            code_counts.update(normalize_barcodes_fast(batch))
+            batch_skipped = code_counts.pop("", 0)
+            skipped_no_code += batch_skipped
+            codes_total += len(batch) - batch_skipped
+            if len(code_counts) > max_codes:
+                runs.append(_spill_run(code_counts, tmp_dir))
+        if runs and code_counts:
+            runs.append(_spill_run(code_counts, tmp_dir))
+    except BaseException:
+        for run in runs:
+            run.unlink(missing_ok=True)
+        raise
+    return code_counts, runs, codes_total, skipped_no_code
+
+
+# Rough CPython cost of one code_counts entry (short str + dict slot), used to turn
+# --memory-budget-bytes into an entry limit.
+_BYTES_PER_CODE = 120
+
+
+def _spill_run(code_counts: dict[str, int], tmp_dir: Path | None) -> Path:
+    # Writes the counts as a code-sorted run and empties the dict. Sorting the bare keys
+    # (unique, so plain str compares) is cheaper than sorting (code, count) tuples.
+    with tempfile.NamedTemporaryFile(
+        "w", delete=False, dir=tmp_dir, suffix=".run", encoding="utf-8", errors="strict"
+    ) as f:
+        f.writelines(f"{code}\t{code_counts[code]}\n" for code in sorted(code_counts))
+    code_counts.clear()
+    return Path(f.name)
+
+
+def _read_run(path: Path) -> Iterator[tuple[str, int]]:
+    with path.open("r", encoding="utf-8", errors="strict") as f:
+        for line in f:
+            code, count = line.rstrip("\n").split("\t")
+            yield code, int(count)
+
+
+def _merge_runs(paths: list[Path]) -> Iterator[tuple[str, int]]:
+    # Runs are code-sorted, so after a k-way merge equal codes are adjacent and can be summed.
+    prev: str | None = None
+    total = 0
+    for code, count in heapq.merge(*(_read_run(p) for p in paths)):
+        if code != prev:
+            if prev is not None:
+                yield prev, total
+            prev, total = code, 0
+        total += count
+    if prev is not None:
+        yield prev, total
+
+
+def _scan_duplicates(
+    code_counts: Iterable[tuple[str, int]], max_samples: int, fh: BinaryIO | None
+) -> tuple[int, int, list[str]]:
+    # One pass over code-sorted (code, count) pairs from any backend; returns duplicate
+    # values, extra occurrences and the first max_samples duplicate codes.
+    duplicate_values = 0
+    duplicate_occurrences = 0
+    samples: list[str] = []
+    append_sample = samples.append
+    fh_write = fh.write if fh is not None else None
+    for code, count in code_counts:
+        if count < 2:
+            continue
+        duplicate_values += 1
+        duplicate_occurrences += count - 1
+        if fh_write is not None:
+            fh_write(f"{code}\n".encode())
+        if duplicate_values <= max_samples:
+            append_sample(code)
+    return duplicate_values, duplicate_occurrences, samples
+
+
+def _start_sort(tmp_dir: Path | None, buffer_size: str | None) -> subprocess.Popen[str]:
+    cmd = ["sort"]
+    if tmp_dir is not None:
+        cmd.extend(["-T", str(tmp_dir)])
+    if buffer_size is not None:
+        cmd.extend(["-S", buffer_size])
+    env = os.environ.copy()
+    env["LC_ALL"] = "C"
+    try:
+        return subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env=env,
+            encoding="utf-8",
+            errors="strict",
+        )
+    except FileNotFoundError:
+        raise SystemExit("Missing required external command: sort") from None
+
+
+def _copy_codes(conn: psycopg.Connection, table: sql.Composable, codes: list[str]) -> None:
+    # One transaction per batch keeps each COPY under Cockroach's transaction size limits.
+    with conn.cursor() as cur:
+        with cur.copy(sql.SQL("COPY {} (code_norm) FROM STDIN").format(table)) as copy:
+            for code in codes:
+                copy.write_row((code,))
+    conn.commit()
+    codes.clear()
 
 
 def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
@@ -73,11 +266,55 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default=None,
         help="Write unique duplicate code_norm values to this path (one per line).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Processes scanning byte ranges in parallel (default: CPU count). Only used for uncompressed input with --dedup-backend memory and without --strict-csv; otherwise the scan is serial.",
+    )
+    parser.add_argument(
+        "--strict-csv",
+        action="store_true",
+        help="Parse rows with csv.reader (quote-aware) instead of splitting lines on the delimiter.",
+    )
+    parser.add_argument(
+        "--dedup-backend",
+        choices=["memory", "sort", "db"],
+        default="memory",
+        help="Duplicate detection: memory (in-process counts), sort (external sort, for code sets that don't fit in RAM), or db (COPY codes to CockroachDB and GROUP BY there).",
+    )
+    parser.add_argument(
+        "--memory-budget-bytes",
+        type=int,
+        default=8 * 1024**3,
+        help="Approximate memory for --dedup-backend memory counts; past it, sorted runs are spilled to --sort-tmp-dir and merged at the end. Parallel scans split it evenly between the worker processes and the parent.",
+    )
+    parser.add_argument(
+        "--db-schema",
+        default="openfoodfacts",
+        help="Schema for the transient code table used by --dedup-backend db.",
+    )
+    parser.add_argument(
+        "--db-chunk-rows",
+        type=int,
+        default=200_000,
+        help="Codes per COPY transaction for --dedup-backend db.",
+    )
+    parser.add_argument(
+        "--database-url-env",
+        default="DATABASE_URL",
+        help="Env var name containing DB URL (--dedup-backend db).",
+    )
     parser.add_argument(
         "--sort-tmp-dir",
         type=Path,
         default=None,
-        help="Temporary directory for external sort spill files.",
+        help="Temporary directory for external sort / memory-budget spill files.",
+    )
+    parser.add_argument(
+        "--sort-buffer-size",
+        default=None,
+        help="Main-memory buffer for external sort (passed to sort -S, e.g. 2G).",
     )
     parser.add_argument("--log-file", type=Path, default=None, help="Optional JSONL/text log file.")
     parser.add_argument(
@@ -88,6 +325,11 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
 
 def _write_manifest(path: Path, payload: dict[str, object]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        path.write_bytes(
+            orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2) + b"\n"
+        )
+        return
     with path.open("w", encoding="utf-8", errors="strict") as f:
         json.dump(payload, f, ensure_ascii=True, indent=2, sort_keys=True)
         f.write("\n")
@@ -96,9 +338,11 @@ def _write_manifest(path: Path, payload: dict[str, object]) -> None:
 def main(argv: list[str] | None = None) -> int:
     args = _parse_args(argv)
     logger = Logger(fmt=args.log_format, log_file=args.log_file)
-    unsorted_path: Path | None = None
-    sorted_path: Path | None = None
-    duplicate_fh = None
+    sort_proc: subprocess.Popen[str] | None = None
+    runs: list[Path] = []
+    duplicate_fh: BinaryIO | None = None
+    db_conn: psycopg.Connection | None = None
+    codes_table = sql.Identifier(args.db_schema, "preflight_code_norm")
     try:
         if not args.tsv_path.exists():
             raise SystemExit(f"Missing input: {args.tsv_path}")
@@ -108,24 +352,13 @@ def main(argv: list[str] | None = None) -> int:
         except OverflowError:
             raise SystemExit(f"--field-size-limit is too large: {args.field_size_limit}") from None
 
-        file_sha256 = _sha256(args.tsv_path)
         file_bytes = args.tsv_path.stat().st_size
 
-        open_fn = gzip.open if args.tsv_path.suffix == ".gz" else open
-        with open_fn(
-            args.tsv_path,
-            "rt",
-            encoding="utf-8",
-            errors=args.encoding_errors,
-            newline="",
-        ) as f:
+        with _open_hashed(args.tsv_path, encoding_errors=args.encoding_errors) as (f, hashing):
             header_line = f.readline()
             if not header_line:
                 raise SystemExit(f"Empty file: {args.tsv_path}")
 
-            if header_line.startswith("\ufeff"):
-                header_line = header_line.lstrip("\ufeff")
-
             detected = _detect_delimiter(header_line)
             delimiter = args.delimiter
             if args.delimiter == "\t" and detected != "\t":
@@ -137,73 +370,170 @@ def main(argv: list[str] | None = None) -> int:
 
             if "code" not in header_to_index:
                 raise SystemExit("Input is missing required column: code")
-
-            def get(row: list[str], name: str) -> str:
-                idx = header_to_index.get(name)
-                if idx is None or idx >= len(row):
-                    return ""
-                return row[idx]
+            code_idx = header_to_index["code"]
 
             codes_total = 0
             skipped_no_code = 0
-
-            with tempfile.NamedTemporaryFile(
-                "w", delete=False, encoding="utf-8", errors="strict"
-            ) as tmp:
-                unsorted_path = Path(tmp.name)
-                reader = csv.reader(f, delimiter=delimiter)
-                for _row_number, row in enumerate(reader, start=2):
-                    raw_code = get(row, "code").strip()
-                    code_norm = normalize_barcode(raw_code).normalized
-                    if code_norm == "":
-                        skipped_no_code += 1
-                        continue
-                    tmp.write(code_norm + "\n")
-                    codes_total += 1
-
-        sorted_path = unsorted_path.with_suffix(".sorted")
-        cmd = ["sort"]
-        if args.sort_tmp_dir is not None:
-            cmd.extend(["-T", str(args.sort_tmp_dir)])
-        cmd.extend(["-o", str(sorted_path), str(unsorted_path)])
-        env = os.environ.copy()
-        env["LC_ALL"] = "C"
-        t0 = time.time()
-        try:
-            subprocess.run(cmd, check=True, env=env)
-        except FileNotFoundError:
-            raise SystemExit("Missing required external command: sort") from None
-        except subprocess.CalledProcessError as e:
-            raise SystemExit(f"External sort failed with exit code {e.returncode}") from None
-
-        duplicate_values = 0
-        duplicate_occurrences = 0
-        duplicate_samples: list[str] = []
-        duplicate_codes_count = 0
-        prev: str | None = None
-        prev_count = 0
+            # --dedup-backend memory: code_norm -> occurrences, counted during the read pass.
+            code_counts: Counter[str] = Counter()
+            max_codes = max(1, args.memory_budget_bytes // _BYTES_PER_CODE)
+            # --dedup-backend db: codes waiting for the next COPY batch.
+            db_batch: list[str] = []
+            if args.dedup_backend == "db":
+                db_conn = connect(
+                    database_url_env=args.database_url_env,
+                    application_name="foodb-openfoodfacts-preflight",
+                )
+                with db_conn.cursor() as cur:
+                    cur.execute(
+                        sql.SQL("CREATE SCHEMA IF NOT EXISTS {}").format(
+                            sql.Identifier(args.db_schema)
+                        )
+                    )
+                    cur.execute(sql.SQL("DROP TABLE IF EXISTS {}").format(codes_table))
+                    cur.execute(
+                        sql.SQL("CREATE TABLE {} (code_norm STRING NOT NULL)").format(codes_table)
+                    )
+                db_conn.commit()
+
+            parallel = (
+                args.workers > 1
+                and args.tsv_path.suffix != ".gz"
+                and args.dedup_backend == "memory"
+                and not args.strict_csv
+            )
+            if parallel:
+                # Worker processes scan line-aligned byte ranges and return partial counts
+                # or spilled runs; the hash is a separate sequential read on a thread
+                # meanwhile. The budget is split into equal shares for the workers and the
+                # parent, which merges returned counts only while they fit in its share.
+                ranges = data_ranges(args.tsv_path, args.workers)
+                share_codes = max(1, max_codes // (len(ranges) + 1))
+                tasks = [
+                    (
+                        args.tsv_path,
+                        start,
+                        end,
+                        delimiter,
+                        code_idx,
+                        args.encoding_errors,
+                        share_codes,
+                        args.sort_tmp_dir,
+                    )
+                    for start, end in ranges
+                ]
+                # The pool forks its workers before the hash thread starts, so no worker is
+                # forked from a process with a read in flight on another thread.
+                with (
+                    multiprocessing.get_context().Pool(max(1, len(tasks))) as pool,
+                    ThreadPoolExecutor(max_workers=1) as hasher,
+                ):
+                    sha_future = hasher.submit(_sha256, args.tsv_path)
+                    for part_counts, part_runs, part_total, part_skipped in pool.imap_unordered(
+                        _count_range, tasks
+                    ):
+                        runs.extend(part_runs)
+                        # Returned counts already hold a worker's share, so a batch that
+                        # doesn't fit the parent's share goes straight to a run.
+                        if len(code_counts) + len(part_counts) <= share_codes:
+                            code_counts.update(part_counts)
+                        elif part_counts:
+                            runs.append(_spill_run(part_counts, args.sort_tmp_dir))
+                        codes_total += part_total
+                        skipped_no_code += part_skipped
+                    file_sha256 = sha_future.result()
+            else:
+                sort_in = None
+                if args.dedup_backend == "sort":
+                    # Codes are piped straight into sort; no intermediate unsorted file.
+                    sort_proc = _start_sort(args.sort_tmp_dir, args.sort_buffer_size)
+                    sort_in = sort_proc.stdin
+                if args.strict_csv:
+                    raw_codes = (
+                        row[code_idx] if code_idx < len(row) else ""
+                        for row in csv.reader(f, delimiter=delimiter)
+                    )
+                else:
+                    # Only `code` is needed, so skip the csv state machine and per-row lists.
+                    raw_codes = _split_field(f, delimiter, code_idx)
+                if sort_in is None and db_conn is None:
+                    # Batches are normalized with one translate and counted by Counter.update()
+                    # in C; the memory budget is checked between batches.
+                    while batch := list(islice(raw_codes, _COUNT_BATCH_ROWS)):
+                        code_counts.update(normalize_barcodes_fast(batch))
+                        batch_skipped = code_counts.pop("", 0)
+                        skipped_no_code += batch_skipped
+                        codes_total += len(batch) - batch_skipped
+                        if len(code_counts) > max_codes:
+                            runs.append(_spill_run(code_counts, args.sort_tmp_dir))
+                else:
+                    code_norms = (normalize_barcode_fast(raw_code) for raw_code in raw_codes)
+                    for code_norm in code_norms:
+                        if code_norm == "":
+                            skipped_no_code += 1
+                            continue
+                        if sort_in is not None:
+                            sort_in.write(code_norm + "\n")
+                        else:
+                            db_batch.append(code_norm)
+                            if len(db_batch) >= args.db_chunk_rows:
+                                _copy_codes(db_conn, codes_table, db_batch)
+                        codes_total += 1
+                if db_conn is not None and db_batch:
+                    _copy_codes(db_conn, codes_table, db_batch)
+                if sort_in is not None:
+                    sort_in.close()
+
+                file_sha256 = hashing.hexdigest()
 
         if args.duplicate_codes_out is not None:
             args.duplicate_codes_out.parent.mkdir(parents=True, exist_ok=True)
-            duplicate_fh = args.duplicate_codes_out.open("w", encoding="utf-8", errors="strict")
-
-        with sorted_path.open("r", encoding="utf-8", errors="strict") as f:
-            for line in f:
-                code = line.rstrip("\n")
-                if code == prev:
-                    duplicate_occurrences += 1
-                    prev_count += 1
-                    if prev_count == 2:
-                        duplicate_values += 1
-                        if duplicate_fh is not None:
-                            duplicate_fh.write(code + "\n")
-                            duplicate_codes_count += 1
-                        if len(duplicate_samples) < args.duplicate_samples:
-                            duplicate_samples.append(code)
-                else:
-                    prev = code
-                    prev_count = 1
+            # Binary with a large buffer: codes are encoded once each, no text-layer writes.
+            duplicate_fh = args.duplicate_codes_out.open("wb", buffering=1024 * 1024)
 
+        t0 = time.time()
+        if db_conn is not None:
+            # STRING ordering is byte order, i.e. the same LC_ALL=C order as the sort backend.
+            with db_conn.cursor() as cur:
+                cur.execute(
+                    sql.SQL(
+                        "SELECT code_norm, count(*) FROM {} GROUP BY code_norm HAVING count(*) > 1 "
+                        "ORDER BY code_norm"
+                    ).format(codes_table)
+                )
+                duplicate_values, duplicate_occurrences, duplicate_samples = _scan_duplicates(
+                    cur, args.duplicate_samples, duplicate_fh
+                )
+            db_conn.commit()
+        elif sort_proc is None and runs:
+            # Over budget at some point: the residual counts become one more run, and the
+            # merged runs come out code-sorted like every other backend.
+            runs.append(_spill_run(code_counts, args.sort_tmp_dir))
+            duplicate_values, duplicate_occurrences, duplicate_samples = _scan_duplicates(
+                _merge_runs(runs), args.duplicate_samples, duplicate_fh
+            )
+        elif sort_proc is None:
+            # Sorted so the duplicate list and samples match the sort backend's LC_ALL=C
+            # order (UTF-8 byte order is code point order).
+            duplicates = sorted(code for code, count in code_counts.items() if count > 1)
+            duplicate_values = len(duplicates)
+            duplicate_occurrences = sum(code_counts[code] - 1 for code in duplicates)
+            duplicate_samples = duplicates[: args.duplicate_samples]
+            if duplicate_fh is not None:
+                duplicate_fh.write("".join(f"{code}\n" for code in duplicates).encode())
+        else:
+            with sort_proc.stdout as f:
+                # Equal codes are adjacent in sort's output; groupby runs them together in C.
+                duplicate_values, duplicate_occurrences, duplicate_samples = _scan_duplicates(
+                    ((line.rstrip("\n"), sum(1 for _ in group)) for line, group in groupby(f)),
+                    args.duplicate_samples,
+                    duplicate_fh,
+                )
+            returncode = sort_proc.wait()
+            if returncode != 0:
+                raise SystemExit(f"External sort failed with exit code {returncode}")
+
+        duplicate_codes_count = duplicate_values if duplicate_fh is not None else 0
         unique_codes = codes_total - duplicate_occurrences
         duplicates_found = duplicate_values > 0
         elapsed = round(time.time() - t0, 2)
@@ -227,6 +557,7 @@ def main(argv: list[str] | None = None) -> int:
             if args.duplicate_codes_out is not None
             else None,
             "skipped_no_code": skipped_no_code,
+            "dedup_backend": args.dedup_backend,
             "sort_seconds": elapsed,
         }
 
@@ -241,13 +572,28 @@ def main(argv: list[str] | None = None) -> int:
 
         return 0
     finally:
-        if unsorted_path is not None and unsorted_path.exists():
-            unsorted_path.unlink()
-        if sorted_path is not None and sorted_path.exists():
-            sorted_path.unlink()
-        if duplicate_fh is not None:
-            duplicate_fh.close()
-        logger.close()
+        try:
+            for run in runs:
+                run.unlink(missing_ok=True)
+            if sort_proc is not None and sort_proc.poll() is None:
+                sort_proc.kill()
+                sort_proc.wait()
+            if duplicate_fh is not None:
+                duplicate_fh.close()
+            if db_conn is not None:
+                try:
+                    # Best effort: a failure here would replace the error being raised, and
+                    # the next db run drops the staging table before creating it anyway.
+                    if not db_conn.broken:
+                        with contextlib.suppress(psycopg.Error):
+                            db_conn.rollback()
+                            with db_conn.cursor() as cur:
+                                cur.execute(sql.SQL("DROP TABLE IF EXISTS {}").format(codes_table))
+                            db_conn.commit()
+                finally:
+                    db_conn.close()
+        finally:
+            logger.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+# Large sequential reads keep syscall count low on multi-GB exports.
+_READ_BUFFER_BYTES = 4 * 1024 * 1024
+
+
+def data_ranges(path: Path, parts: int) -> list[tuple[int, int]]:
+    # Byte ranges after the header line, each starting at a line boundary, for the --workers
+    # scans of uncompressed exports. Assumes one record per line (no quoted embedded
+    # newlines), which holds for the OFF export.
+    size = path.stat().st_size
+    with path.open("rb") as f:
+        header = f.readline()
+        # The header ends at its first line break, which may be a bare CR (see read_range).
+        cr = header.find(b"\r")
+        if cr != -1 and header[cr + 1 : cr + 2] != b"\n":
+            f.seek(cr + 1)
+        bounds = [f.tell()]
+        for i in range(1, parts):
+            f.seek(max(bounds[0] + (size - bounds[0]) * i // parts, bounds[-1]))
+            f.readline()
+            bounds.append(f.tell())
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:], strict=False) if end > start]
+
+
+def read_range(path: Path, start: int, end: int, *, encoding_errors: str) -> Iterator[str]:
+    # Yields the same lines as the serial TextIOWrapper(newline=""): a bare CR ends a line
+    # too. Range bounds sit after a LF, so they are line ends under either rule.
+    with path.open("rb", buffering=_READ_BUFFER_BYTES) as raw:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(raw.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        raw.seek(start)
+        pos = start
+        for line in raw:
+            if pos >= end:
+                break
+            pos += len(line)
+            text = line.decode("utf-8", encoding_errors)
+            cr = text.find("\r")
+            if cr == -1 or (cr == len(text) - 2 and text[-1] == "\n"):
+                yield text
+                continue
+            # Only the final CR can be part of a CRLF, since the line ends at its first LF.
+            crlf = text.endswith("\r\n")
+            pieces = (text[:-2] if crlf else text).split("\r")
+            for piece in pieces[:-1]:
+                yield piece + "\r"
+            if last := pieces[-1] + ("\r\n" if crlf else ""):
+                yield last
@@ -5,7 +5,9 @@ import argparse
 import json
 import os
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -55,6 +57,12 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default="text",
         help="Log format for --log-file (and stdout).",
     )
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=1,
+        help="Build indexes on up to this many tables at once, one connection each (default: 1). Indexes on the same table are always built one after another.",
+    )
     parser.add_argument(
         "--database-url-env",
         default="DATABASE_URL",
@@ -68,9 +76,12 @@ def _normalize(name: str) -> str:
 
 
 class Logger:
+    _RESERVED = frozenset({"ts", "event"})
+
     def __init__(self, *, log_file: Path | None, fmt: str) -> None:
         self._fmt = fmt
         self._fh = None
+        self._lock = threading.Lock()
         if log_file is not None:
             log_file.parent.mkdir(parents=True, exist_ok=True)
             self._fh = log_file.open("a", encoding="utf-8", errors="strict")
@@ -88,12 +99,13 @@ class Logger:
         if self._fmt == "jsonl":
             line = json.dumps(payload, ensure_ascii=False)
         else:
-            kv = " ".join(f"{k}={payload[k]}" for k in payload if k not in {"ts", "event"})
+            kv = " ".join(f"{k}={payload[k]}" for k in payload if k not in self._RESERVED)
             line = f"[{payload['ts']}] {name}" + (f" {kv}" if kv else "")
-        print(line, flush=True)
-        if self._fh is not None:
-            self._fh.write(line + "\n")
-            self._fh.flush()
+        with self._lock:
+            print(line, flush=True)
+            if self._fh is not None:
+                self._fh.write(line + "\n")
+                self._fh.flush()
 
 
 def _index_specs(schema: str) -> list[IndexSpec]:
@@ -139,6 +151,49 @@ def _index_specs(schema: str) -> list[IndexSpec]:
     ]
 
 
+# On Postgres a failed CREATE INDEX CONCURRENTLY leaves an INVALID index behind, which
+# IF NOT EXISTS would then skip; such leftovers are dropped so the build runs again.
+_INVALID_INDEX_QUERY = (
+    "SELECT 1 FROM pg_index i"
+    " JOIN pg_class c ON c.oid = i.indexrelid"
+    " JOIN pg_namespace n ON n.oid = c.relnamespace"
+    " WHERE n.nspname = %s AND c.relname = %s AND NOT i.indisvalid"
+)
+
+
+def _create_table_indexes(
+    db_url: str, schema: str, specs: list[IndexSpec], logger: Logger, task: int
+) -> None:
+    # Autocommit: CONCURRENTLY can't run inside a transaction block on Postgres, and each
+    # DDL then commits itself without a separate COMMIT round-trip.
+    with psycopg.connect(
+        db_url,
+        connect_timeout=10,
+        application_name=f"foodb-usda-indexes-w{task}",
+        autocommit=True,
+    ) as conn:
+        with conn.cursor() as cur:
+            for spec in specs:
+                logger.event("index_start", index=spec.name, table=spec.table)
+                t0 = time.time()
+                cur.execute(_INVALID_INDEX_QUERY, (schema, spec.name))
+                if cur.fetchone() is not None:
+                    logger.event("index_drop_invalid", index=spec.name)
+                    cur.execute(
+                        sql.SQL("DROP INDEX CONCURRENTLY IF EXISTS {}.{}").format(
+                            sql.Identifier(schema), sql.Identifier(spec.name)
+                        )
+                    )
+                stmt = sql.SQL("CREATE INDEX CONCURRENTLY IF NOT EXISTS {} ON {}.{} ({})").format(
+                    sql.Identifier(spec.name),
+                    sql.Identifier(schema),
+                    sql.Identifier(spec.table),
+                    sql.SQL(", ").join(sql.Identifier(c) for c in spec.columns),
+                )
+                cur.execute(stmt)
+                logger.event("index_done", index=spec.name, seconds=round(time.time() - t0, 2))
+
+
 def main(argv: list[str] | None = None) -> int:
     args = _parse_args(argv)
     only = {_normalize(x) for x in args.only}
@@ -186,22 +241,30 @@ def main(argv: list[str] | None = None) -> int:
                 )
                 existing_tables = {r[0] for r in cur.fetchall()}
 
-                for spec in specs:
-                    if spec.table not in existing_tables:
-                        logger.event("index_skip_missing_table", index=spec.name, table=spec.table)
-                        continue
-
-                    logger.event("index_start", index=spec.name, table=spec.table)
-                    t0 = time.time()
-                    stmt = sql.SQL("CREATE INDEX IF NOT EXISTS {} ON {}.{} ({})").format(
-                        sql.Identifier(spec.name),
-                        sql.Identifier(args.schema),
-                        sql.Identifier(spec.table),
-                        sql.SQL(", ").join(sql.Identifier(c) for c in spec.columns),
+        # Indexes on different tables are independent; the ones on a table stay in one worker.
+        by_table: dict[str, list[IndexSpec]] = {}
+        for spec in specs:
+            if spec.table not in existing_tables:
+                logger.event("index_skip_missing_table", index=spec.name, table=spec.table)
+                continue
+            by_table.setdefault(spec.table, []).append(spec)
+
+        if by_table:
+            workers = max(1, min(len(by_table), args.max_parallel))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(
+                        _create_table_indexes,
+                        db_url,
+                        args.schema,
+                        table_specs,
+                        logger,
+                        i,
                     )
-                    cur.execute(stmt)
-                    conn.commit()
-                    logger.event("index_done", index=spec.name, seconds=round(time.time() - t0, 2))
+                    for i, table_specs in enumerate(by_table.values())
+                ]
+                for future in futures:
+                    future.result()
 
         logger.event("index_run_done")
         return 0
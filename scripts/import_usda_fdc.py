@@ -3,21 +3,44 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import csv
-import io
 import json
+import multiprocessing
+import multiprocessing.util
 import os
+import queue
+import random
 import re
+import struct
 import sys
+import threading
 import time
-from collections.abc import Iterable
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime
+from functools import lru_cache
+from itertools import chain, islice, repeat
+from multiprocessing.sharedctypes import Synchronized
 from pathlib import Path
+from typing import BinaryIO, TextIO
 
 import psycopg
 from psycopg import sql
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:
+    pa = None
+
 
 def _parse_env_file(path: Path) -> dict[str, str]:
     if not path.exists():
@@ -46,26 +69,82 @@ def _database_url() -> str:
     return url
 
 
+# Session settings for --bulk-load-tuning, sent as libpq startup options so every load,
+# worker and index connection gets them.
+_BULK_LOAD_SETTINGS = (
+    "synchronous_commit=off",
+    "maintenance_work_mem=1GB",
+    "work_mem=256MB",
+    "temp_buffers=256MB",
+)
+
+
+def _connect(
+    database_url: str, args: argparse.Namespace, *, autocommit: bool = False
+) -> psycopg.Connection:
+    kwargs: dict[str, str] = {}
+    if args.bulk_load_tuning:
+        kwargs["options"] = " ".join(f"-c {setting}" for setting in _BULK_LOAD_SETTINGS)
+    return psycopg.connect(
+        database_url, application_name="foodb-usda-import", autocommit=autocommit, **kwargs
+    )
+
+
 def _quote_ident(identifier: str) -> str:
     return '"' + identifier.replace('"', '""') + '"'
 
 
 _NON_ALNUM = re.compile(r"[^a-z0-9]+")
-_INT_RE = re.compile(r"^-?\d+$")
-_FLOAT_RE = re.compile(r"^-?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE]-?\d+)?$")
-_DATE_ISO_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
-_DATE_SLASH_RE = re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{4})$")
+# ASCII digits only: int()/float() also accept other scripts' digits, which the server rejects.
+_INT_RE = re.compile(r"^-?\d+$", re.ASCII)
+_FLOAT_RE = re.compile(r"^-?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE]-?\d+)?$", re.ASCII)
+_DATE_SLASH_RE = re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{4})$", re.ASCII)
+# Up to 18 digits always fits INT8; longer values are range-checked.
+_INT8_SAFE_DIGITS = 18
+_INT8_MIN, _INT8_MAX = -(2**63), 2**63 - 1
+
+_COPY_ESCAPE = str.maketrans(
+    {
+        "\\": "\\\\",
+        "\t": "\\t",
+        "\n": "\\n",
+        "\r": "\\r",
+        "\b": "\\b",
+        "\f": "\\f",
+        "\v": "\\v",
+    }
+)
+_COPY_NEEDS_ESCAPE = re.compile("[" + re.escape("".join(map(chr, _COPY_ESCAPE))) + "]")
 
 
+def _escape_copy_text(value: str) -> str:
+    # Most cells need no escaping: one C-level scan and no allocation for those, and a
+    # single translate pass (not one replace per special character) for the rest.
+    if _COPY_NEEDS_ESCAPE.search(value) is None:
+        return value
+    return value.translate(_COPY_ESCAPE)
+
+
+# Date columns repeat a handful of values (e.g. publication_date) across millions of rows.
+@lru_cache(maxsize=4096)
 def _normalize_date(value: str) -> str:
     value = value.strip()
-    if _DATE_ISO_RE.match(value):
-        return value
-    m = _DATE_SLASH_RE.match(value)
-    if m:
+    # ISO dates dominate; a few index checks and one isdecimal() (the regexes' \d) instead of a
+    # regex match.
+    digits = value[:4] + value[5:7] + value[8:]
+    if len(value) == 10 and value[4] == value[7] == "-" and digits.isascii() and digits.isdecimal():
+        normalized = value
+    elif m := _DATE_SLASH_RE.match(value):
         month, day, year = m.groups()
-        return f"{year}-{int(month):02d}-{int(day):02d}"
-    raise ValueError(f"invalid DATE value {value!r}")
+        normalized = f"{year}-{int(month):02d}-{int(day):02d}"
+    else:
+        raise ValueError(f"invalid DATE value {value!r}")
+    # Well-formed is not enough: 2020-13-45 must fail here, naming its row, not in COPY.
+    try:
+        date.fromisoformat(normalized)
+    except ValueError:
+        raise ValueError(f"invalid DATE value {value!r}") from None
+    return normalized
 
 
 def _normalize_identifier(raw: str) -> str:
@@ -96,7 +175,18 @@ def _unique_identifiers(raw_headers: list[str]) -> list[str]:
     return out
 
 
-def _maybe_extract_dictionary_text(pdf_path: Path) -> str | None:
+def _extract_pdf_text(pdf_path: Path) -> str | None:
+    # PyMuPDF is much faster than pypdf on large PDFs; either is optional.
+    try:
+        import pymupdf  # type: ignore
+    except Exception:
+        pymupdf = None
+    if pymupdf is not None:
+        try:
+            with pymupdf.open(pdf_path) as doc:
+                return "\n".join(page.get_text() for page in doc)
+        except Exception:
+            pass
     try:
         from pypdf import PdfReader  # type: ignore
     except Exception:
@@ -111,29 +201,61 @@ def _maybe_extract_dictionary_text(pdf_path: Path) -> str | None:
         return None
 
 
-def _dictionary_coverage_report(
-    dictionary_text: str, *, table: str, raw_headers: Iterable[str]
-) -> tuple[bool, list[str]]:
-    normalized_text = dictionary_text.replace("\u00a0", " ")
-    found_table = bool(re.search(rf"\b{re.escape(table)}\b", normalized_text))
-    missing: list[str] = []
-    for header in raw_headers:
-        token = header.strip()
-        if not token:
-            continue
-        if token not in normalized_text:
-            missing.append(token)
-    return found_table, missing
+def _maybe_extract_dictionary_text(pdf_path: Path) -> str | None:
+    # Extraction takes seconds and the PDF practically never changes, so the text is cached
+    # next to it, keyed by the PDF's mtime and size.
+    try:
+        stat = pdf_path.stat()
+    except OSError:
+        return None
+    key = f"{stat.st_mtime_ns}-{stat.st_size}"
+    cache = pdf_path.with_suffix(".txt.cache")
+    try:
+        with cache.open(encoding="utf-8", newline="") as fh:
+            cached = fh.read()
+    except (OSError, UnicodeDecodeError):
+        cached = ""
+    if cached.startswith(key + "\n"):
+        return cached[len(key) + 1 :]
 
+    text = _extract_pdf_text(pdf_path)
+    if text is not None:
+        with contextlib.suppress(OSError):
+            cache.write_text(f"{key}\n{text}", encoding="utf-8", newline="")
+    return text
 
-def _column_type(table: str, column: str) -> str:
-    # In recent USDA releases, `food.csv`'s `food_category_id` is not consistently an integer FK;
-    # it's often a branded category name (e.g., "Oils Edible"), but can still be numeric for
-    # SR Legacy foods. Store as STRING to handle both.
-    if table == "food" and column == "food_category_id":
-        return "STRING"
 
-    date_cols = {
+def _dictionary_coverage_report(
+    dictionary_text: str, specs: Iterable[TableSpec]
+) -> dict[str, tuple[bool, list[str]]]:
+    # One pass for all tables: every distinct header token is looked up once, with a single
+    # Aho-Corasick sweep of the text when pyahocorasick is installed.
+    specs = list(specs)
+    normalized_text = dictionary_text.replace("\u00a0", " ")
+    tokens = {header.strip() for spec in specs for header in spec.raw_headers} - {""}
+    if ahocorasick is not None and tokens:
+        automaton = ahocorasick.Automaton()
+        for token in tokens:
+            automaton.add_word(token, token)
+        automaton.make_automaton()
+        found = {token for _, token in automaton.iter(normalized_text)}
+    else:
+        found = {token for token in tokens if token in normalized_text}
+
+    report: dict[str, tuple[bool, list[str]]] = {}
+    for spec in specs:
+        found_table = bool(re.search(rf"\b{re.escape(spec.table)}\b", normalized_text))
+        missing = [
+            token
+            for token in (header.strip() for header in spec.raw_headers)
+            if token and token not in found
+        ]
+        report[spec.table] = (found_table, missing)
+    return report
+
+
+_DATE_COLS = frozenset(
+    {
         "acquisition_date",
         "available_date",
         "discontinued_date",
@@ -145,7 +267,9 @@ def _column_type(table: str, column: str) -> str:
         "sell_by_date",
         "start_date",
     }
-    float_cols = {
+)
+_FLOAT_COLS = frozenset(
+    {
         "adjusted_amount",
         "amount",
         "carbohydrate_value",
@@ -164,7 +288,9 @@ def _column_type(table: str, column: str) -> str:
         "serving_size",
         "value",
     }
-    int_cols = {
+)
+_INT_COLS = frozenset(
+    {
         "data_points",
         "food_group_id",
         "min_year_acquired",
@@ -172,19 +298,32 @@ def _column_type(table: str, column: str) -> str:
         "sr_addmod_year",
         "wweia_category_code",
     }
-    text_force = {
+)
+_TEXT_FORCE_COLS = frozenset(
+    {
         "gtin_upc",
         "ndb_number",
         "upc_code",
     }
+)
+
+
+# (table, column) pairs are few and fixed; DDL and every load attempt ask for the same ones.
+@lru_cache(maxsize=1024)
+def _column_type(table: str, column: str) -> str:
+    # In recent USDA releases, `food.csv`'s `food_category_id` is not consistently an integer FK;
+    # it's often a branded category name (e.g., "Oils Edible"), but can still be numeric for
+    # SR Legacy foods. Store as STRING to handle both.
+    if table == "food" and column == "food_category_id":
+        return "STRING"
 
-    if column in date_cols or column.endswith("_date"):
+    if column in _DATE_COLS or column.endswith("_date"):
         return "DATE"
-    if column in text_force:
+    if column in _TEXT_FORCE_COLS:
         return "STRING"
-    if column in float_cols:
+    if column in _FLOAT_COLS:
         return "FLOAT8"
-    if column in int_cols:
+    if column in _INT_COLS:
         return "INT8"
 
     # Common IDs (keep as INT8) unless they are clearly codes.
@@ -224,6 +363,446 @@ def _count_csv_data_rows(csv_path: Path) -> int:
         return sum(1 for _ in reader)
 
 
+_CSV_BLOCK_BYTES = 64 * 1024 * 1024
+# Maps every byte that isn't a quote, comma or line break to "a", so quote placement can be
+# checked with plain substring searches.
+_CSV_SHAPE = bytes(b if b in b'",\r\n' else ord("a") for b in range(256))
+_QUOTE_MARKS = bytes.maketrans(b"CO", b'""')
+
+
+def _csv_line_blocks(f: BinaryIO) -> Iterator[bytes]:
+    # Reads f in large blocks cut after their last newline, so every block but the final one
+    # ends on a line break and no CRLF pair or quote run is split between blocks.
+    rest = b""
+    while block := f.read(_CSV_BLOCK_BYTES):
+        cut = block.rfind(b"\n") + 1
+        if not cut:
+            rest += block
+            continue
+        yield rest + block[:cut]
+        rest = block[cut:]
+    if rest:
+        yield rest
+
+
+def _csv_unquoted_newlines(block: bytes, in_quotes: bool) -> tuple[int, bool] | None:
+    # Counts the newlines outside quoted fields in a block from _csv_line_blocks by quote
+    # parity, and returns it with whether the block ends inside a quoted field. Returns None
+    # where csv.reader could split records differently: a bare CR, or a quote that can't be
+    # where parity puts it, i.e. an opening quote right after an ordinary byte (12" in an
+    # unquoted field, which csv.reader keeps as a literal) or a closing quote right before one.
+    shape = block.translate(_CSV_SHAPE)
+    if b'a"a' in shape or shape.count(b"\r") != shape.count(b"\r\n"):
+        return None
+    # C marks a quote after an ordinary byte, O one before an ordinary byte; "" pairs keep
+    # the parity, so they need no special casing.
+    marks = shape.replace(b'a"', b"C").replace(b'"a', b"O").translate(None, b"a,\r")
+    quotes = marks.translate(None, b"\n")
+    if b"C" in quotes[in_quotes::2] or b"O" in quotes[1 - in_quotes :: 2]:
+        return None
+    # Dropping "" pairs leaves at most one quote per line, on lines with odd quote parity.
+    segments = marks.translate(_QUOTE_MARKS).replace(b'""', b"").split(b'"')
+    return b"".join(segments[in_quotes::2]).count(b"\n"), bool(in_quotes ^ (len(quotes) % 2))
+
+
+# Resume seeks to the nearest indexed data row, then skips at most this many rows.
+_LINE_INDEX_STRIDE = 1000
+# Bumped whenever the indexing rules change, so stale .lineidx caches are rebuilt.
+_LINE_INDEX_VERSION = 2
+
+
+def _csv_line_index(csv_path: Path) -> array[int]:
+    # Byte offsets of every _LINE_INDEX_STRIDE-th data row, cached next to the CSV as
+    # <name>.lineidx (uint64s, led by the CSV's mtime and size and the index version as the
+    # cache key). Record boundaries follow quote parity like _csv_record_chunks; files where
+    # csv.reader would split records differently get an empty index, so every reader skips
+    # rows itself.
+    stat = csv_path.stat()
+    key = [stat.st_mtime_ns, stat.st_size, _LINE_INDEX_VERSION]
+    index_path = csv_path.with_name(csv_path.name + ".lineidx")
+    index = array("Q")
+    with contextlib.suppress(OSError, ValueError):
+        index.frombytes(index_path.read_bytes())
+    if index[: len(key)].tolist() == key:
+        return index[len(key) :]
+
+    index = array("Q", key)
+    with csv_path.open("rb") as f:
+        pos = 0
+        records = 0
+        in_quotes = False
+        for block in _csv_line_blocks(f):
+            if _csv_unquoted_newlines(block, in_quotes) is None:
+                del index[len(key) :]
+                break
+            for line in block.splitlines(keepends=True):
+                if not in_quotes:
+                    # A record starts here; record 0 is the header.
+                    if records and (records - 1) % _LINE_INDEX_STRIDE == 0:
+                        index.append(pos)
+                    records += 1
+                if line.count(b'"') % 2:
+                    in_quotes = not in_quotes
+                pos += len(line)
+    with contextlib.suppress(OSError):
+        index_path.write_bytes(index.tobytes())
+    return index[len(key) :]
+
+
+def _seek_data_row(f: BinaryIO, csv_path: Path, row: int) -> int | None:
+    # Positions f at the indexed data row at or before `row` (0-based, header excluded) and
+    # returns how many rows are left to skip, or None (f untouched) when there are no data rows.
+    index = _csv_line_index(csv_path)
+    if not index:
+        return None
+    slot = min(row // _LINE_INDEX_STRIDE, len(index) - 1)
+    f.seek(index[slot])
+    return row - slot * _LINE_INDEX_STRIDE
+
+
+def _advise_sequential(f: BinaryIO | TextIO) -> None:
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
+def _advise_done(f: BinaryIO | TextIO) -> None:
+    # A table's CSV is read once, so its cached pages can go as soon as the read finishes
+    # instead of pushing out other data.
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+# --table-segments only splits tables whose CSV is at least this large.
+_SEGMENT_MIN_BYTES = 16 * 1024 * 1024
+
+
+def _table_segments(csv_path: Path, parts: int) -> list[tuple[int, int | None]] | None:
+    # Splits the data rows into up to `parts` (first_row, rows) ranges that start on line-index
+    # slots, so each segment seeks straight to its first record; the last one runs to the end
+    # of the file (rows is None). Returns None when the table isn't split.
+    if parts < 2 or csv_path.stat().st_size < _SEGMENT_MIN_BYTES:
+        return None
+    slots = len(_csv_line_index(csv_path))
+    starts = [
+        slot * _LINE_INDEX_STRIDE for slot in sorted({slots * i // parts for i in range(parts)})
+    ]
+    if len(starts) < 2:
+        return None
+    return [(start, end - start) for start, end in zip(starts, starts[1:], strict=False)] + [
+        (starts[-1], None)
+    ]
+
+
+def _csv_record_chunks(
+    f: BinaryIO, chunk_rows: int, *, skip_rows: int, limit: int | None = None
+) -> Iterator[tuple[bytes, int]]:
+    # Groups raw CSV lines into chunks of whole records without parsing fields, stopping after
+    # `limit` records when given. A newline ends a record only when the quotes seen so far are
+    # balanced ("" escapes count twice), so quoted newlines stay inside their record.
+    lines: list[bytes] = []
+    rows = 0
+    in_quotes = False
+    if limit == 0:
+        return
+    for line in f:
+        if line.count(b'"') % 2:
+            in_quotes = not in_quotes
+        if skip_rows:
+            if not in_quotes:
+                skip_rows -= 1
+            continue
+        lines.append(line)
+        if not in_quotes:
+            rows += 1
+            if rows >= chunk_rows or rows == limit:
+                yield b"".join(lines), rows
+                lines.clear()
+                if limit is not None:
+                    limit -= rows
+                    if not limit:
+                        return
+                rows = 0
+    if lines:
+        yield b"".join(lines), rows
+
+
+def _split_simple_csv(lines: list[str], ncols: int) -> list[list[str]] | None:
+    # Splits a block of lines straight into columns with a few whole-block str passes, when
+    # every line is one record of ncols fields that are either all quoted without embedded
+    # quotes or newlines ("a","b") or all unquoted (a,b), i.e. the shape of the USDA exports.
+    # Returns None for anything else, which csv.reader then parses.
+    if ncols < 2 or not lines:
+        return None
+    nl = "\r\n" if lines[0].endswith("\r\n") else "\n"
+    text = "".join(lines)
+    if not text.endswith(nl):
+        text += nl
+    nrows = len(lines)
+    if (
+        text.count(nl) != nrows
+        or text.count("\n") != nrows
+        or text.count("\r") != (nrows if nl == "\r\n" else 0)
+    ):
+        return None
+    if text[0] == '"':
+        if not text.endswith('"' + nl):
+            return None
+        sep = '","'
+        fields = text[1 : -len(nl) - 1].replace('"' + nl + '"', sep).split(sep)
+        # Every quote must be a field delimiter (so no field contains one), and every line
+        # must hold exactly ncols quoted fields.
+        if text.count('"') != 2 * len(fields) or set(map(str.count, lines, repeat('"'))) != {
+            2 * ncols
+        }:
+            return None
+    elif '"' in text:
+        return None
+    else:
+        fields = text[: -len(nl)].replace(nl, ",").split(",")
+        if set(map(str.count, lines, repeat(","))) != {ncols - 1}:
+            return None
+    return [fields[i::ncols] for i in range(ncols)]
+
+
+def _csv_text_chunks(
+    f: TextIO, chunk_rows: int, ncols: int, *, limit: int | None = None
+) -> Iterator[tuple[list[list[str]] | None, list[list[str]] | None]]:
+    # Yields (rows, None) or (None, columns) per chunk of chunk_rows records, stopping after
+    # `limit` records when given. f must be opened with newline="" so lines split exactly where
+    # csv.reader would see them; a line is then never more than one record, so reading as many
+    # records as the block has lines, from the block plus the rest of the file, always consumes
+    # the whole block and stops on a record boundary.
+    while lines := list(islice(f, chunk_rows if limit is None else min(chunk_rows, limit))):
+        columns = _split_simple_csv(lines, ncols)
+        if columns is not None:
+            records = len(lines)
+            yield None, columns
+        else:
+            rows = list(islice(csv.reader(chain(lines, f)), len(lines)))
+            records = len(rows)
+            yield rows, None
+        if limit is not None:
+            limit -= records
+
+
+# --parser arrow reads the CSV in blocks of this size (pyarrow parses a block per thread).
+_ARROW_BLOCK_BYTES = 16 * 1024 * 1024
+
+
+def _arrow_csv_chunks(
+    csv_path: Path, ncols: int, chunk_rows: int, *, first_row: int, limit: int | None = None
+) -> Iterator[tuple[None, list[list[str]]]]:
+    # Same contract as _csv_text_chunks, parsed by pyarrow's multithreaded reader instead.
+    # Every column is read as a string (empty fields stay ""), so cleaning and validation are
+    # unchanged; record batches are regrouped into chunks of chunk_rows records.
+    names = [str(i) for i in range(ncols)]
+    with csv_path.open("rb") as f:
+        _advise_sequential(f)
+        skip_rows = _seek_data_row(f, csv_path, first_row) if first_row else None
+        reader = pa_csv.open_csv(
+            f,
+            read_options=pa_csv.ReadOptions(
+                column_names=names,
+                # Without a line-index seek, skip the header row too.
+                skip_rows=0 if skip_rows is not None else 1,
+                skip_rows_after_names=skip_rows if skip_rows is not None else first_row,
+                block_size=_ARROW_BLOCK_BYTES,
+            ),
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(column_types=dict.fromkeys(names, pa.string())),
+        )
+        pending: list[list[str]] = [[] for _ in names]
+        for batch in reader:
+            for column, values in zip(pending, batch.columns, strict=True):
+                column.extend(values.to_pylist())
+            while len(pending[0]) >= chunk_rows or (limit is not None and len(pending[0]) >= limit):
+                n = chunk_rows if limit is None else min(chunk_rows, limit)
+                if n == 0:
+                    return
+                yield None, [column[:n] for column in pending]
+                pending = [column[n:] for column in pending]
+                if limit is not None:
+                    limit -= n
+        n = len(pending[0]) if limit is None else min(len(pending[0]), limit)
+        if n:
+            yield None, [column[:n] for column in pending]
+
+
+_TC_STRING, _TC_INT8, _TC_FLOAT8, _TC_DATE = range(4)
+_TYPECODES = {"STRING": _TC_STRING, "INT8": _TC_INT8, "FLOAT8": _TC_FLOAT8, "DATE": _TC_DATE}
+
+
+@lru_cache(maxsize=64)
+def _row_cleaner(
+    csv_path: Path, columns: tuple[str, ...], column_types: tuple[str, ...]
+) -> Callable[[Sequence[str], int], list[str]]:
+    # Generates (once per table) a straight-line cleaner for its column types: the row is
+    # unpacked into locals and each cell gets only its own type's checks, so there is no
+    # per-cell loop or type dispatch. Checks, their order and messages match cell by cell.
+    ncols = len(columns)
+    names = [f"v{i}" for i in range(ncols)]
+    lines = [
+        "def clean(row, row_number):",
+        f"    if len(row) != {ncols}:",
+        "        raise ValueError(",
+        f'            f"{{csv_path}} row {{row_number}}: expected {ncols} columns, got {{len(row)}}"',
+        "        )",
+        f"    {', '.join(names)}, = row",
+    ]
+    for i, (name, col_type) in enumerate(zip(names, column_types, strict=True)):
+        typecode = _TYPECODES[col_type]
+        where = f'f"{{csv_path}} row {{row_number}} col {{columns[{i}]}}: '
+        lines.append(f"    if {name}:")
+        if typecode != _TC_STRING:
+            lines.append(f"        {name} = {name}.strip()")
+        lines.append(f"        if '\\x00' in {name}:")
+        lines.append(f'            raise ValueError({where}NUL byte not allowed")')
+        if typecode == _TC_INT8:
+            lines.append(f"        if not int_match({name}):")
+            lines.append(f'            raise ValueError({where}invalid INT8 value {{{name}!r}}")')
+            lines.append(
+                f"        if len({name}) > {_INT8_SAFE_DIGITS} and not "
+                f"{_INT8_MIN} <= int({name}) <= {_INT8_MAX}:"
+            )
+            lines.append(
+                f'            raise ValueError({where}INT8 value out of range {{{name}!r}}")'
+            )
+        elif typecode == _TC_FLOAT8:
+            lines.append(f"        if not float_match({name}):")
+            lines.append(f'            raise ValueError({where}invalid FLOAT8 value {{{name}!r}}")')
+        elif typecode == _TC_DATE:
+            lines.append("        try:")
+            lines.append(f"            {name} = normalize_date({name})")
+            lines.append("        except ValueError as e:")
+            lines.append(f'            raise ValueError({where}{{e}}") from e')
+    lines.append(f"    return [{', '.join(names)}]")
+    namespace = {
+        "csv_path": csv_path,
+        "columns": columns,
+        "int_match": _INT_RE.match,
+        "float_match": _FLOAT_RE.match,
+        "normalize_date": _normalize_date,
+    }
+    exec("\n".join(lines), namespace)
+    return namespace["clean"]
+
+
+def _clean_rows(
+    csv_path: Path,
+    rows: Sequence[Sequence[str]],
+    columns: list[str],
+    column_types: list[str],
+    *,
+    first_row_number: int,
+) -> list[list[str]]:
+    # Row-at-a-time validation; raises ValueError naming the first bad cell. Returns the cleaned
+    # rows (numbers stripped, dates normalized, "" for NULL).
+    clean = _row_cleaner(csv_path, tuple(columns), tuple(column_types))
+    return [clean(row, row_number) for row_number, row in enumerate(rows, start=first_row_number)]
+
+
+def _clean_columns(
+    columns: Sequence[Sequence[str]], column_types: list[str], *, validate: bool = True
+) -> list[Sequence[str]] | None:
+    # Column-at-a-time fast path for the same checks: each column is checked and converted
+    # with map/count passes that stay in C, instead of per-cell branches. Returns None when any
+    # cell fails (or is an edge case such as whitespace-only); the caller then reruns the
+    # chunk through _clean_rows, which produces the result or the exact error.
+    # With validate=False (text COPY only), INT8/FLOAT8 cells are only stripped and left for
+    # the server to reject; cells that would need COPY escaping (or hold NUL) still take the
+    # checked path.
+    cleaned: list[Sequence[str]] = []
+    for col_type, values in zip(column_types, columns, strict=True):
+        if col_type == "STRING":
+            if "\x00" in "".join(values):
+                return None
+            cleaned.append(values)
+        elif col_type == "DATE":
+            try:
+                cleaned.append([_normalize_date(v) if v else "" for v in values])
+            except ValueError:
+                return None
+        else:
+            match = _INT_RE.match if col_type == "INT8" else _FLOAT_RE.match
+            stripped = list(map(str.strip, values))
+            # A whitespace-only cell strips to "" and is invalid, not NULL.
+            if stripped.count("") != values.count(""):
+                return None
+            joined = "".join(stripped)
+            if not validate:
+                if "\x00" in joined or _COPY_NEEDS_ESCAPE.search(joined):
+                    return None
+            # Plain unsigned integers (the usual case) pass a single isdecimal() check, which
+            # matches the regexes' ASCII \d; anything else is matched cell by cell.
+            elif not (
+                (col_type == "INT8" and joined.isascii() and joined.isdecimal())
+                or all(map(match, filter(None, stripped)))
+            ):
+                return None
+            # Cells long enough to overflow INT8 are range-checked in _clean_rows.
+            if (
+                validate
+                and col_type == "INT8"
+                and max(map(len, stripped), default=0) > _INT8_SAFE_DIGITS
+            ):
+                return None
+            cleaned.append(stripped)
+    return cleaned
+
+
+def _copy_text(cleaned: Sequence[Sequence[str]], column_types: list[str]) -> bytes:
+    # COPY text format: tab-separated, \N for NULL; only strings can need escaping.
+    out_columns = [
+        [_escape_copy_text(v) if v else "\\N" for v in values]
+        if col_type == "STRING"
+        else [v or "\\N" for v in values]
+        for col_type, values in zip(column_types, cleaned, strict=True)
+    ]
+    # Every column has one value per row, so the per-row length check of strict=True is skipped.
+    lines = map("\t".join, zip(*out_columns, strict=False))
+    # The trailing "" gives the final newline without copying the joined chunk again.
+    return "\n".join(chain(lines, ("",))).encode("utf-8")
+
+
+_PGCOPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+_PGCOPY_TRAILER = struct.pack("!h", -1)
+_PGCOPY_NULL = struct.pack("!i", -1)
+_PGCOPY_LENGTH = struct.Struct("!i").pack
+_PGCOPY_INT8 = struct.Struct("!iq").pack
+_PGCOPY_FLOAT8 = struct.Struct("!id").pack
+_PGCOPY_DATE = struct.Struct("!ii").pack
+_PG_EPOCH_ORDINAL = date(2000, 1, 1).toordinal()
+
+
+@lru_cache(maxsize=4096)
+def _pgcopy_date(value: str) -> bytes:
+    return _PGCOPY_DATE(4, date.fromisoformat(value).toordinal() - _PG_EPOCH_ORDINAL)
+
+
+def _pgcopy_string(value: str) -> bytes:
+    data = value.encode("utf-8")
+    return _PGCOPY_LENGTH(len(data)) + data
+
+
+def _copy_binary(cleaned: Sequence[Sequence[str]], column_types: list[str]) -> bytes:
+    # COPY binary format: each field is length-prefixed, numbers and dates are sent as their
+    # big-endian wire values, so nothing needs escaping. Fields are encoded a column at a time
+    # and interleaved with the per-row field count in one join.
+    out_columns: list[list[bytes]] = []
+    for col_type, values in zip(column_types, cleaned, strict=True):
+        if col_type == "INT8":
+            out_columns.append([_PGCOPY_INT8(8, int(v)) if v else _PGCOPY_NULL for v in values])
+        elif col_type == "FLOAT8":
+            out_columns.append([_PGCOPY_FLOAT8(8, float(v)) if v else _PGCOPY_NULL for v in values])
+        elif col_type == "DATE":
+            out_columns.append([_pgcopy_date(v) if v else _PGCOPY_NULL for v in values])
+        else:
+            out_columns.append([_pgcopy_string(v) if v else _PGCOPY_NULL for v in values])
+    field_count = struct.pack("!h", len(column_types))
+    fields = chain.from_iterable(zip(repeat(field_count), *out_columns))
+    return b"".join(chain((_PGCOPY_HEADER,), fields, (_PGCOPY_TRAILER,)))
+
+
 def _primary_key_for(table: str, columns: list[str]) -> list[str] | None:
     if "id" in columns:
         return ["id"]
@@ -256,26 +835,30 @@ def _primary_key_for(table: str, columns: list[str]) -> list[str] | None:
     return None
 
 
+def _table_spec(csv_path: Path) -> TableSpec:
+    table = _normalize_identifier(csv_path.stem)
+    raw_headers = _read_csv_header(csv_path)
+    columns = _unique_identifiers(raw_headers)
+    return TableSpec(
+        table=table,
+        csv_path=csv_path,
+        raw_headers=raw_headers,
+        columns=columns,
+        primary_key=_primary_key_for(table, columns),
+    )
+
+
 def _table_specs(csv_dir: Path) -> list[TableSpec]:
-    csv_paths = sorted(p for p in csv_dir.glob("*.csv") if p.is_file())
-    specs: list[TableSpec] = []
-    for csv_path in csv_paths:
-        if csv_path.name == "all_downloaded_table_record_counts.csv":
-            continue
-        table = _normalize_identifier(csv_path.stem)
-        raw_headers = _read_csv_header(csv_path)
-        columns = _unique_identifiers(raw_headers)
-        pk = _primary_key_for(table, columns)
-        specs.append(
-            TableSpec(
-                table=table,
-                csv_path=csv_path,
-                raw_headers=raw_headers,
-                columns=columns,
-                primary_key=pk,
-            )
-        )
-    return specs
+    csv_paths = sorted(
+        p
+        for p in csv_dir.glob("*.csv")
+        if p.is_file() and p.name != "all_downloaded_table_record_counts.csv"
+    )
+    if not csv_paths:
+        return []
+    # Header reads are I/O-bound; overlap the opens on slow storage. map() keeps the order.
+    with ThreadPoolExecutor(max_workers=min(16, len(csv_paths))) as pool:
+        return list(pool.map(_table_spec, csv_paths))
 
 
 def _ddl_for_table(schema: str, spec: TableSpec) -> str:
@@ -313,6 +896,576 @@ def _reorder_specs(specs: list[TableSpec], only_args: list[str]) -> list[TableSp
     return sorted(specs, key=sort_key)
 
 
+def _fmt_duration(seconds: float) -> str:
+    seconds = max(0.0, seconds)
+    if seconds < 90:
+        return f"{seconds:.1f}s"
+    return f"{seconds/60:.1f}m"
+
+
+class Logger:
+    _RESERVED = frozenset({"ts", "event"})
+
+    def __init__(self, *, log_file: Path | None, fmt: str) -> None:
+        self._fmt = fmt
+        self._fh = None
+        # Index builds and COPY progress log from threads as well as the main thread.
+        self._lock = threading.Lock()
+        if log_file is not None:
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = log_file.open("a", encoding="utf-8", errors="strict")
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+
+    def event(self, name: str, **fields: object) -> None:
+        payload = {
+            "ts": datetime.now(UTC).isoformat(timespec="seconds"),
+            "event": name,
+            **fields,
+        }
+        if self._fmt == "jsonl":
+            line = json.dumps(payload, ensure_ascii=False)
+        else:
+            kv = " ".join(f"{k}={payload[k]}" for k in payload if k not in self._RESERVED)
+            line = f"[{payload['ts']}] {name}" + (f" {kv}" if kv else "")
+        # One write per line so events from parallel table workers don't interleave.
+        with self._lock:
+            print(line + "\n", end="", flush=True)
+            if self._fh is not None:
+                self._fh.write(line + "\n")
+                self._fh.flush()
+
+
+class _RunProgress:
+    # Run-wide row counts for progress/ETA events. With --workers the loaded-row count is a
+    # shared multiprocessing.Value, so every worker reports totals for the whole run.
+    def __init__(
+        self,
+        *,
+        logger: Logger,
+        loaded_rows: int,
+        known_total: int,
+        every_s: float,
+        t0: float,
+        shared: Synchronized[int] | None = None,
+    ) -> None:
+        self._logger = logger
+        self._loaded_rows = loaded_rows
+        self._baseline_rows = loaded_rows
+        self._known_total = known_total
+        self._every_s = every_s
+        self._t0 = t0
+        self._shared = shared
+        self._next = time.monotonic() + every_s
+
+    @property
+    def loaded_rows(self) -> int:
+        return self._shared.value if self._shared is not None else self._loaded_rows
+
+    def add(self, rows: int) -> int:
+        if self._shared is None:
+            self._loaded_rows += rows
+            return self._loaded_rows
+        with self._shared.get_lock():
+            self._shared.value += rows
+            return self._shared.value
+
+    def due(self) -> bool:
+        return time.monotonic() >= self._next
+
+    def report(self, table: str, table_rows_done: int, table_rows_expected: int | None) -> None:
+        loaded_rows = self.loaded_rows
+        known_total = self._known_total
+        elapsed = time.time() - self._t0
+        pct = (loaded_rows / known_total) * 100.0 if known_total else None
+        run_rows = loaded_rows - self._baseline_rows
+        eta_s = (
+            ((known_total - loaded_rows) / (run_rows / elapsed))
+            if known_total and run_rows and elapsed > 0
+            else None
+        )
+        self._logger.event(
+            "progress",
+            table=table,
+            table_rows_done=table_rows_done,
+            table_rows_expected=table_rows_expected,
+            overall_rows_done=loaded_rows,
+            overall_rows_expected=known_total,
+            overall_pct=round(pct, 2) if pct is not None else None,
+            eta=_fmt_duration(eta_s) if eta_s is not None else None,
+        )
+        self._next = time.monotonic() + self._every_s
+
+
+# Parsed chunks allowed to queue ahead of the COPY writer thread (bounds memory).
+_PIPELINE_DEPTH = 2
+
+
+class _ChunkPipeline:
+    # Commits COPY chunks on one background thread so the next chunk is parsed while the
+    # previous one is sent and committed. The bounded queue caps buffered chunks; the
+    # connection is only touched by the writer thread while the pipeline is open.
+    def __init__(self, commit: Callable[[sql.Composed, bytes, int], None]) -> None:
+        self._commit = commit
+        self._queue: queue.Queue[tuple[sql.Composed, bytes, int] | None] = queue.Queue(
+            maxsize=_PIPELINE_DEPTH
+        )
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._run, name="copy-writer", daemon=True)
+
+    def __enter__(self) -> _ChunkPipeline:
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, tb: object) -> None:
+        self._queue.put(None)
+        self._thread.join()
+        if exc is None and self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        while (item := self._queue.get()) is not None:
+            if self._error is not None:
+                continue  # keep draining so the producer never blocks on a dead writer
+            try:
+                self._commit(*item)
+            except BaseException as e:
+                self._error = e
+
+    def put(self, stmt: sql.Composed, data: bytes, rows: int) -> None:
+        if self._error is not None:
+            raise self._error
+        self._queue.put((stmt, data, rows))
+
+
+class _CopyProgressObserver:
+    # --server-progress: polls pg_stat_progress_copy (Postgres 14+) from a second connection
+    # for the loading backend, so progress inside a large in-flight chunk is visible before
+    # the chunk commits. Observation only; failures are logged once and never stop the load.
+    def __init__(
+        self,
+        database_url: str,
+        args: argparse.Namespace,
+        *,
+        logger: Logger,
+        table: str,
+        backend_pid: int,
+    ) -> None:
+        self._database_url = database_url
+        self._args = args
+        self._logger = logger
+        self._table = table
+        self._backend_pid = backend_pid
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="copy-progress", daemon=True)
+
+    def __enter__(self) -> _CopyProgressObserver:
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, tb: object) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        try:
+            with _connect(self._database_url, self._args, autocommit=True) as conn:
+                while not self._stop.wait(self._args.progress_every_s):
+                    row = conn.execute(
+                        "SELECT bytes_processed, bytes_total, tuples_processed"
+                        " FROM pg_stat_progress_copy WHERE pid = %s",
+                        (self._backend_pid,),
+                    ).fetchone()
+                    if row is None:
+                        continue  # between chunks
+                    bytes_processed, bytes_total, tuples_processed = row
+                    self._logger.event(
+                        "copy_progress",
+                        table=self._table,
+                        chunk_rows_done=tuples_processed,
+                        chunk_bytes_done=bytes_processed,
+                        chunk_bytes_total=bytes_total or None,
+                    )
+        except psycopg.Error as e:
+            self._logger.event(
+                "copy_progress_unavailable", table=self._table, error=type(e).__name__
+            )
+
+
+def _observe_copy(
+    database_url: str,
+    conn: psycopg.Connection,
+    args: argparse.Namespace,
+    *,
+    logger: Logger,
+    table: str,
+) -> contextlib.AbstractContextManager[object]:
+    if not args.server_progress:
+        return contextlib.nullcontext()
+    return _CopyProgressObserver(
+        database_url, args, logger=logger, table=table, backend_pid=conn.info.backend_pid
+    )
+
+
+def _load_table(
+    conn: psycopg.Connection,
+    spec: TableSpec,
+    *,
+    args: argparse.Namespace,
+    logger: Logger,
+    progress: _RunProgress,
+    dictionary_coverage: tuple[bool, list[str]] | None,
+    expected: int | None,
+    existing: int,
+    segment: tuple[int, int | None] | None = None,
+) -> None:
+    # segment is (first_row, rows) when only part of the table is loaded here (rows is None
+    # for the rest of the file); the caller then owns truncating the table.
+    first_row, limit = (existing, None) if segment is None else segment
+    # The statements only depend on the table, so they're composed once rather than per
+    # attempt.
+    table_sql = sql.SQL("{}.{}").format(sql.Identifier(args.schema), sql.Identifier(spec.table))
+    cols_sql = sql.SQL(", ").join(sql.Identifier(c) for c in spec.columns)
+    truncate_stmt = sql.SQL("TRUNCATE TABLE {}").format(table_sql)
+    encode: Callable[[Sequence[Sequence[str]], list[str]], bytes] = _copy_text
+    if args.copy_format == "csv":
+        # Raw records go straight to the server's CSV parser; quoted empty fields still load
+        # as NULL, like the text path's "" -> \N.
+        copy_stmt = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT CSV, FORCE_NULL ({}))").format(
+            table_sql, cols_sql, cols_sql
+        )
+    elif args.copy_format == "binary":
+        copy_stmt = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT BINARY)").format(
+            table_sql, cols_sql
+        )
+        encode = _copy_binary
+    else:
+        copy_stmt = sql.SQL("COPY {} ({}) FROM STDIN").format(table_sql, cols_sql)
+
+    with conn.cursor() as cur:
+        if args.truncate and segment is None:
+            logger.event("table_truncate", table=spec.table)
+            cur.execute(truncate_stmt)
+            conn.commit()
+
+        size_mib = spec.csv_path.stat().st_size / 1024 / 1024
+        logger.event(
+            "table_start",
+            table=spec.table,
+            expected_rows=expected,
+            size_mib=round(size_mib, 2),
+        )
+        if segment is not None:
+            logger.event("table_segment", table=spec.table, first_row=first_row, rows=limit)
+
+        if args.resume and expected is not None and existing == expected and expected != 0:
+            logger.event("table_already_loaded", table=spec.table, rows=existing)
+            return
+        if args.resume and existing:
+            logger.event("table_resume", table=spec.table, existing_rows=existing)
+
+        if dictionary_coverage is not None:
+            found_table, missing = dictionary_coverage
+            if not found_table:
+                logger.event("dictionary_miss_table", table=spec.table)
+            elif missing:
+                logger.event(
+                    "dictionary_miss_headers",
+                    table=spec.table,
+                    missing_headers=len(missing),
+                )
+
+        column_types = [_column_type(spec.table, c) for c in spec.columns]
+        attempt = 0
+        validate = not args.no_validate
+        use_arrow = args.parser == "arrow"
+        table_committed_rows = 0
+        while True:
+            try:
+                table_t0 = time.time()
+
+                # COPY in chunks to avoid CockroachDB lock-intent budget limits.
+                def commit_chunk(stmt: sql.Composed, data: bytes, rows: int) -> None:
+                    nonlocal table_committed_rows
+                    with cur.copy(stmt) as copy:
+                        # psycopg splits large writes into small slices; slicing a memoryview
+                        # doesn't copy them.
+                        copy.write(memoryview(data))
+                    if not args.single_transaction:
+                        conn.commit()
+
+                    table_committed_rows += rows
+                    overall_rows = progress.add(rows)
+                    logger.event(
+                        "chunk_commit",
+                        table=spec.table,
+                        rows=rows,
+                        table_rows_done=table_committed_rows,
+                        overall_rows_done=overall_rows,
+                    )
+                    if progress.due():
+                        progress.report(spec.table, table_committed_rows, expected)
+
+                if args.resume:
+                    table_committed_rows = existing
+
+                if args.copy_format == "csv":
+                    with spec.csv_path.open("rb") as f, _ChunkPipeline(commit_chunk) as pipeline:
+                        _advise_sequential(f)
+                        skip_rows = (
+                            _seek_data_row(f, spec.csv_path, first_row) if first_row else None
+                        )
+                        if skip_rows is None:
+                            skip_rows = 1 + first_row
+                        for data, rows in _csv_record_chunks(
+                            f, args.chunk_rows, skip_rows=skip_rows, limit=limit
+                        ):
+                            pipeline.put(copy_stmt, data, rows)
+                        # Other segments may still be reading the file.
+                        if segment is None:
+                            _advise_done(f)
+                    if args.single_transaction:
+                        conn.commit()
+                    dt = time.time() - table_t0
+                    logger.event("table_done", table=spec.table, seconds=round(dt, 2))
+                    break
+
+                with (
+                    spec.csv_path.open("r", encoding="utf-8", errors="strict", newline="") as f,
+                    _ChunkPipeline(commit_chunk) as pipeline,
+                ):
+                    _advise_sequential(f)
+                    ncols = len(spec.columns)
+                    chunks: Iterator[tuple[list[list[str]] | None, list[list[str]] | None]]
+                    if use_arrow:
+                        chunks = _arrow_csv_chunks(
+                            spec.csv_path, ncols, args.chunk_rows, first_row=first_row, limit=limit
+                        )
+                    else:
+                        reader = csv.reader(f)
+                        # On resume, jump near the first missing row via the line index (nothing
+                        # has been read through f yet, so its buffer can still be repositioned).
+                        skip_rows = (
+                            _seek_data_row(f.buffer, spec.csv_path, first_row)
+                            if first_row
+                            else None
+                        )
+                        if skip_rows is None:
+                            try:
+                                next(reader)
+                            except StopIteration as e:
+                                raise ValueError(f"Empty CSV: {spec.csv_path}") from e
+                            skip_rows = first_row
+
+                        for _ in range(skip_rows):
+                            try:
+                                next(reader)
+                            except StopIteration:
+                                break
+                        chunks = _csv_text_chunks(f, args.chunk_rows, ncols, limit=limit)
+                    row_number = 2 + first_row
+                    for rows, columns in chunks:
+                        # Row lengths are checked once here; the transposes below don't
+                        # re-check them per item.
+                        if columns is None and set(map(len, rows)) == {ncols}:
+                            columns = list(zip(*rows, strict=False))
+                        cleaned = (
+                            _clean_columns(columns, column_types, validate=validate)
+                            if columns is not None
+                            else None
+                        )
+                        if cleaned is None:
+                            if rows is None:
+                                rows = list(zip(*columns, strict=False))
+                            cleaned = list(
+                                zip(
+                                    *_clean_rows(
+                                        spec.csv_path,
+                                        rows,
+                                        spec.columns,
+                                        column_types,
+                                        first_row_number=row_number,
+                                    ),
+                                    strict=False,
+                                )
+                            )
+                        data = encode(cleaned, column_types)
+                        chunk_len = len(rows) if rows is not None else len(columns[0])
+                        pipeline.put(copy_stmt, data, chunk_len)
+                        row_number += chunk_len
+                    # Other segments may still be reading the file.
+                    if segment is None:
+                        _advise_done(f)
+
+                if args.single_transaction:
+                    conn.commit()
+                dt = time.time() - table_t0
+                logger.event("table_done", table=spec.table, seconds=round(dt, 2))
+                break
+            except Exception:
+                conn.rollback()
+                attempt += 1
+                # Exponential backoff with jitter, so workers that failed together don't
+                # retry in lockstep.
+                retry_fields: dict[str, object] = {}
+                if attempt <= args.retries:
+                    delay = min(args.retry_sleep_cap_s, args.retry_sleep_s * 2 ** (attempt - 1))
+                    delay *= random.uniform(0.5, 1.5)
+                    retry_fields["next_retry_s"] = round(delay, 2)
+                logger.event(
+                    "table_error",
+                    table=spec.table,
+                    attempt=attempt,
+                    error_type=type(sys.exc_info()[1]).__name__,
+                    error=str(sys.exc_info()[1]),
+                    **retry_fields,
+                )
+                if attempt > args.retries:
+                    raise
+                # Retry with full client-side checks and the stdlib parser, so a bad value or
+                # row is reported by row and column instead of by the server or pyarrow.
+                validate = True
+                use_arrow = False
+                # If we retry, clear any committed rows from this table to avoid duplicates; with
+                # --single-transaction the rollback above already discarded them.
+                if table_committed_rows and not args.single_transaction:
+                    try:
+                        cur.execute(truncate_stmt)
+                        conn.commit()
+                    except Exception as cleanup_error:
+                        conn.rollback()
+                        logger.event(
+                            "table_retry_cleanup_failed",
+                            table=spec.table,
+                            error_type=type(cleanup_error).__name__,
+                            error=str(cleanup_error),
+                        )
+                        raise
+                    logger.event("table_truncate_for_retry", table=spec.table)
+                if table_committed_rows:
+                    progress.add(-table_committed_rows)
+                    table_committed_rows = 0
+                time.sleep(delay)
+
+
+# Set in each --workers process by _init_load_worker.
+_worker_loaded_rows: Synchronized[int] | None = None
+# Each --workers process keeps one connection across the tables and segments it loads.
+_worker_conn: psycopg.Connection | None = None
+
+
+def _init_load_worker(loaded_rows: Synchronized[int]) -> None:
+    global _worker_loaded_rows
+    _worker_loaded_rows = loaded_rows
+    # Pool processes leave through multiprocessing's exit hooks rather than atexit.
+    multiprocessing.util.Finalize(None, _close_worker_connection, exitpriority=10)
+
+
+def _close_worker_connection() -> None:
+    global _worker_conn
+    if _worker_conn is not None:
+        _worker_conn.close()
+        _worker_conn = None
+
+
+def _worker_connection(database_url: str, args: argparse.Namespace) -> psycopg.Connection:
+    global _worker_conn
+    if _worker_conn is None or _worker_conn.closed or _worker_conn.broken:
+        _worker_conn = _connect(database_url, args)
+    return _worker_conn
+
+
+def _load_table_in_worker(
+    database_url: str,
+    spec: TableSpec,
+    *,
+    args: argparse.Namespace,
+    dictionary_coverage: tuple[bool, list[str]] | None,
+    expected: int | None,
+    existing: int,
+    segment: tuple[int, int | None] | None,
+    known_total: int,
+    baseline_rows: int,
+    t0: float,
+) -> None:
+    logger = Logger(log_file=args.log_file, fmt=args.log_format)
+    try:
+        progress = _RunProgress(
+            logger=logger,
+            loaded_rows=baseline_rows,
+            known_total=known_total,
+            every_s=args.progress_every_s,
+            t0=t0,
+            shared=_worker_loaded_rows,
+        )
+        conn = _worker_connection(database_url, args)
+        try:
+            with _observe_copy(database_url, conn, args, logger=logger, table=spec.table):
+                _load_table(
+                    conn,
+                    spec,
+                    args=args,
+                    logger=logger,
+                    progress=progress,
+                    dictionary_coverage=dictionary_coverage,
+                    expected=expected,
+                    existing=existing,
+                    segment=segment,
+                )
+        except BaseException:
+            # Don't hand a connection in an unknown state to the next task.
+            _close_worker_connection()
+            raise
+    finally:
+        logger.close()
+
+
+# (index, table, column) built after the load when the table was part of the run.
+_POST_IMPORT_INDEXES = (
+    ("food_description_idx", "food", "description"),
+    ("branded_food_gtin_upc_idx", "branded_food", "gtin_upc"),
+)
+
+
+# On Postgres a failed CREATE INDEX CONCURRENTLY leaves an INVALID index behind, which
+# IF NOT EXISTS would then skip; such leftovers are dropped so the build runs again.
+_INVALID_INDEX_QUERY = (
+    "SELECT 1 FROM pg_index i"
+    " JOIN pg_class c ON c.oid = i.indexrelid"
+    " JOIN pg_namespace n ON n.oid = c.relnamespace"
+    " WHERE n.nspname = %s AND c.relname = %s AND NOT i.indisvalid"
+)
+
+
+def _create_post_import_index(
+    database_url: str,
+    args: argparse.Namespace,
+    logger: Logger,
+    index: str,
+    table: str,
+    column: str,
+) -> None:
+    # Autocommit: CONCURRENTLY can't run inside a transaction block on Postgres.
+    with _connect(database_url, args, autocommit=True) as conn:
+        if conn.execute(_INVALID_INDEX_QUERY, (args.schema, index)).fetchone() is not None:
+            logger.event("index_drop_invalid", index=index)
+            conn.execute(
+                sql.SQL("DROP INDEX CONCURRENTLY IF EXISTS {}.{}").format(
+                    sql.Identifier(args.schema), sql.Identifier(index)
+                )
+            )
+        conn.execute(
+            sql.SQL("CREATE INDEX CONCURRENTLY IF NOT EXISTS {} ON {}.{} ({})").format(
+                sql.Identifier(index),
+                sql.Identifier(args.schema),
+                sql.Identifier(table),
+                sql.Identifier(column),
+            )
+        )
+
+
 def main(argv: list[str]) -> int:
     parser = argparse.ArgumentParser(
         description="Import USDA FoodData Central CSV bundle into CockroachDB."
@@ -385,15 +1538,68 @@ def main(argv: list[str]) -> int:
         default=10.0,
         help="Emit periodic progress events while loading.",
     )
+    parser.add_argument(
+        "--server-progress",
+        action="store_true",
+        help="Also poll pg_stat_progress_copy (Postgres 14+) on a second connection every --progress-every-s and emit copy_progress events for the COPY in flight.",
+    )
     parser.add_argument(
         "--dictionary-pdf",
         type=Path,
         default=Path("usda/Download_Field_Descriptions_Oct2020.pdf"),
         help="USDA data dictionary PDF (used for coverage warnings).",
     )
+    parser.add_argument(
+        "--copy-format",
+        choices=["text", "binary", "csv"],
+        default="text",
+        help="text: parse, validate and escape rows client-side. binary: same validation, sent as COPY ... WITH (FORMAT BINARY) with numbers and dates in their wire encoding. csv: stream the raw CSV bytes to COPY ... WITH (FORMAT CSV) and let the server parse and type-check them (uses FORCE_NULL, a Postgres COPY option).",
+    )
+    parser.add_argument(
+        "--parser",
+        choices=["python", "arrow"],
+        default="python",
+        help="text/binary: parse CSVs with the stdlib csv module, or with pyarrow's multithreaded reader (requires pyarrow); retries of a failed table use the stdlib parser.",
+    )
+    parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="text: skip client-side INT8/FLOAT8 checks and let the server reject bad values; retries of a failed table run with full validation, so the offending row is reported. Not available with --copy-format binary, whose values are converted client-side.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Load up to this many tables at once, each in its own process and connection (default: 1, one table after another on a single connection).",
+    )
+    parser.add_argument(
+        "--table-segments",
+        type=int,
+        default=1,
+        help="With --workers > 1, split each CSV of 16 MiB or more into this many row ranges, loaded in parallel over separate connections.",
+    )
+    parser.add_argument(
+        "--bulk-load-tuning",
+        action="store_true",
+        help="Start every connection with synchronous_commit=off and larger maintenance_work_mem/work_mem/temp_buffers (Postgres targets).",
+    )
+    parser.add_argument(
+        "--single-transaction",
+        action="store_true",
+        help="Commit each table once after its last chunk instead of per chunk, so a retry only rolls back (Postgres targets; CockroachDB limits transaction size).",
+    )
     parser.add_argument("--retries", type=int, default=0, help="Per-table retry count.")
     parser.add_argument(
-        "--retry-sleep-s", type=float, default=2.0, help="Seconds to sleep between retries."
+        "--retry-sleep-s",
+        type=float,
+        default=2.0,
+        help="Base sleep between retries (seconds); doubles per attempt, with jitter.",
+    )
+    parser.add_argument(
+        "--retry-sleep-cap-s",
+        type=float,
+        default=60.0,
+        help="Upper bound for the backoff before jitter (seconds).",
     )
     args = parser.parse_args(argv)
 
@@ -405,6 +1611,22 @@ def main(argv: list[str]) -> int:
         raise SystemExit(
             "--resume requires --retries 0 (retry truncation would invalidate resume offsets)."
         )
+    if args.no_validate and args.copy_format == "binary":
+        raise SystemExit(
+            "--no-validate cannot be used with --copy-format binary (values are converted to their wire encoding client-side, so the server never sees the text)."
+        )
+    if args.parser == "arrow" and pa is None:
+        raise SystemExit("--parser arrow requires pyarrow (pip install pyarrow).")
+    if args.table_segments < 1:
+        raise SystemExit("--table-segments must be >= 1.")
+    if args.table_segments > 1 and args.resume:
+        raise SystemExit(
+            "--table-segments cannot be used with --resume (segments commit out of order)."
+        )
+    if args.table_segments > 1 and args.retries and not args.single_transaction:
+        raise SystemExit(
+            "--table-segments with --retries requires --single-transaction (a retry can't truncate rows other segments committed)."
+        )
 
     database_url = _database_url()
     if not args.csv_dir.exists():
@@ -423,9 +1645,11 @@ def main(argv: list[str]) -> int:
 
     # Optional dictionary coverage check (PDF is Oct 2020 and may not match newer releases).
     dictionary_text = None
+    dictionary_coverage: dict[str, tuple[bool, list[str]]] = {}
     if args.dictionary_pdf.exists():
         dictionary_text = _maybe_extract_dictionary_text(args.dictionary_pdf)
     if dictionary_text:
+        dictionary_coverage = _dictionary_coverage_report(dictionary_text, specs)
         missing_tables = [s.table for s in specs if s.table not in dictionary_text]
         if missing_tables:
             print(
@@ -446,40 +1670,6 @@ def main(argv: list[str]) -> int:
                 expected_rows[table] = int(row["Number of Records"])
         expected_rows.pop("all_downloaded_table_record_counts", None)
 
-    def _fmt_duration(seconds: float) -> str:
-        seconds = max(0.0, seconds)
-        if seconds < 90:
-            return f"{seconds:.1f}s"
-        return f"{seconds/60:.1f}m"
-
-    class Logger:
-        def __init__(self, *, log_file: Path | None, fmt: str) -> None:
-            self._fmt = fmt
-            self._fh = None
-            if log_file is not None:
-                log_file.parent.mkdir(parents=True, exist_ok=True)
-                self._fh = log_file.open("a", encoding="utf-8", errors="strict")
-
-        def close(self) -> None:
-            if self._fh is not None:
-                self._fh.close()
-
-        def event(self, name: str, **fields: object) -> None:
-            payload = {
-                "ts": datetime.now(UTC).isoformat(timespec="seconds"),
-                "event": name,
-                **fields,
-            }
-            if self._fmt == "jsonl":
-                line = json.dumps(payload, ensure_ascii=False)
-            else:
-                kv = " ".join(f"{k}={payload[k]}" for k in payload if k not in {"ts", "event"})
-                line = f"[{payload['ts']}] {name}" + (f" {kv}" if kv else "")
-            print(line, flush=True)
-            if self._fh is not None:
-                self._fh.write(line + "\n")
-                self._fh.flush()
-
     logger = Logger(log_file=args.log_file, fmt=args.log_format)
 
     selected_csv_bytes = sum(s.csv_path.stat().st_size for s in specs)
@@ -494,9 +1684,7 @@ def main(argv: list[str]) -> int:
 
     t0 = time.time()
     overall_loaded_rows = 0
-    baseline_loaded_rows = 0
     overall_known_total = selected_expected_rows
-    overall_progress_next = time.monotonic() + args.progress_every_s
 
     logger.event(
         "run_start",
@@ -510,7 +1698,7 @@ def main(argv: list[str]) -> int:
 
     run_success = False
     try:
-        with psycopg.connect(database_url, application_name="foodb-usda-import") as conn:
+        with _connect(database_url, args) as conn:
             with conn.cursor() as cur:
                 if args.drop_schema:
                     logger.event("schema_drop", schema=args.schema)
@@ -525,8 +1713,13 @@ def main(argv: list[str]) -> int:
                 )
                 conn.commit()
 
-                for spec in specs:
-                    cur.execute(_ddl_for_table(args.schema, spec))
+                # The CREATE TABLE statements are independent, so with libpq pipeline support
+                # they go out back-to-back instead of one round-trip each.
+                with (
+                    conn.pipeline() if psycopg.Pipeline.is_supported() else contextlib.nullcontext()
+                ):
+                    for spec in specs:
+                        cur.execute(_ddl_for_table(args.schema, spec))
                 conn.commit()
 
                 existing_rows_by_table: dict[str, int] = {}
@@ -562,268 +1755,113 @@ def main(argv: list[str]) -> int:
                                 )
 
                     overall_loaded_rows = sum(existing_rows_by_table.values())
-                    baseline_loaded_rows = overall_loaded_rows
                     if overall_loaded_rows:
                         logger.event("run_resume", existing_rows=overall_loaded_rows)
 
-                for spec in specs:
-                    if args.truncate:
-                        logger.event("table_truncate", table=spec.table)
-                        cur.execute(
-                            sql.SQL("TRUNCATE TABLE {}.{}").format(
-                                sql.Identifier(args.schema), sql.Identifier(spec.table)
-                            )
-                        )
-                        conn.commit()
+                progress = _RunProgress(
+                    logger=logger,
+                    loaded_rows=overall_loaded_rows,
+                    known_total=overall_known_total,
+                    every_s=args.progress_every_s,
+                    t0=t0,
+                )
+                # With --table-segments, large tables are split into row ranges that load as
+                # separate worker tasks, each over its own connection.
+                segments = {
+                    spec.table: _table_segments(spec.csv_path, args.table_segments)
+                    if args.workers > 1
+                    else None
+                    for spec in specs
+                }
+                tasks = [
+                    (spec, segment) for spec in specs for segment in segments[spec.table] or [None]
+                ]
 
+                def task_expected(
+                    spec: TableSpec, segment: tuple[int, int | None] | None
+                ) -> int | None:
                     expected = expected_rows.get(spec.table)
-                    size_mib = spec.csv_path.stat().st_size / 1024 / 1024
-                    logger.event(
-                        "table_start",
-                        table=spec.table,
-                        expected_rows=expected,
-                        size_mib=round(size_mib, 2),
-                    )
-
-                    existing = existing_rows_by_table.get(spec.table, 0) if args.resume else 0
-                    if (
-                        args.resume
-                        and expected is not None
-                        and existing == expected
-                        and expected != 0
-                    ):
-                        logger.event("table_already_loaded", table=spec.table, rows=existing)
-                        continue
-                    if args.resume and existing:
-                        logger.event("table_resume", table=spec.table, existing_rows=existing)
-
-                    if dictionary_text:
-                        found_table, missing = _dictionary_coverage_report(
-                            dictionary_text, table=spec.table, raw_headers=spec.raw_headers
-                        )
-                        if not found_table:
-                            logger.event("dictionary_miss_table", table=spec.table)
-                        elif missing:
-                            logger.event(
-                                "dictionary_miss_headers",
-                                table=spec.table,
-                                missing_headers=len(missing),
-                            )
-
-                    attempt = 0
-                    table_committed_rows = 0
-                    while True:
-                        try:
-                            table_t0 = time.time()
-
-                            # COPY in chunks to avoid CockroachDB lock-intent budget limits.
-                            cols_sql = sql.SQL(", ").join(sql.Identifier(c) for c in spec.columns)
-                            copy_stmt = sql.SQL("COPY {}.{} ({}) FROM STDIN").format(
-                                sql.Identifier(args.schema),
-                                sql.Identifier(spec.table),
-                                cols_sql,
+                    if segment is None:
+                        return expected
+                    first_row, rows = segment
+                    if rows is None and expected is not None:
+                        return max(0, expected - first_row)
+                    return rows
+
+                workers = max(1, min(args.workers, len(tasks)))
+                if workers == 1:
+                    for spec in specs:
+                        with _observe_copy(
+                            database_url, conn, args, logger=logger, table=spec.table
+                        ):
+                            _load_table(
+                                conn,
+                                spec,
+                                args=args,
+                                logger=logger,
+                                progress=progress,
+                                dictionary_coverage=dictionary_coverage.get(spec.table),
+                                expected=expected_rows.get(spec.table),
+                                existing=existing_rows_by_table.get(spec.table, 0)
+                                if args.resume
+                                else 0,
                             )
-
-                            rows_in_chunk = 0
-                            buf = io.StringIO()
-
-                            def escape_copy_text(value: str) -> str:
-                                return (
-                                    value.replace("\\", "\\\\")
-                                    .replace("\t", "\\t")
-                                    .replace("\n", "\\n")
-                                    .replace("\r", "\\r")
-                                    .replace("\b", "\\b")
-                                    .replace("\f", "\\f")
-                                    .replace("\v", "\\v")
-                                )
-
-                            def flush() -> None:
-                                nonlocal \
-                                    rows_in_chunk, \
-                                    buf, \
-                                    table_committed_rows, \
-                                    overall_loaded_rows
-                                data = buf.getvalue()
-                                if not data:
-                                    return
-                                with cur.copy(copy_stmt) as copy:
-                                    copy.write(data)
-                                conn.commit()
-
-                                table_committed_rows += rows_in_chunk
-                                overall_loaded_rows += rows_in_chunk
-                                logger.event(
-                                    "chunk_commit",
-                                    table=spec.table,
-                                    rows=rows_in_chunk,
-                                    table_rows_done=table_committed_rows,
-                                    overall_rows_done=overall_loaded_rows,
+                else:
+                    # Tables are independent during the load, so each worker process takes a
+                    # whole table (or one segment of it) over its own connection; the run-wide
+                    # row count is shared. Segments can't truncate their table themselves.
+                    for spec in specs:
+                        if args.truncate and segments[spec.table]:
+                            logger.event("table_truncate", table=spec.table)
+                            cur.execute(
+                                sql.SQL("TRUNCATE TABLE {}.{}").format(
+                                    sql.Identifier(args.schema), sql.Identifier(spec.table)
                                 )
-                                rows_in_chunk = 0
-                                buf = io.StringIO()
-
-                            column_types = [_column_type(spec.table, c) for c in spec.columns]
-                            if args.resume:
-                                table_committed_rows = existing
-
-                            with spec.csv_path.open(
-                                "r", encoding="utf-8", errors="strict", newline=""
-                            ) as f:
-                                reader = csv.reader(f)
-                                try:
-                                    next(reader)
-                                except StopIteration as e:
-                                    raise ValueError(f"Empty CSV: {spec.csv_path}") from e
-
-                                expected_cols = len(spec.columns)
-                                if args.resume and existing:
-                                    for _ in range(existing):
-                                        try:
-                                            next(reader)
-                                        except StopIteration:
-                                            break
-                                for row_number, row in enumerate(reader, start=2 + existing):
-                                    if len(row) != expected_cols:
-                                        raise ValueError(
-                                            f"{spec.csv_path} row {row_number}: expected {expected_cols} columns, got {len(row)}"
-                                        )
-
-                                    cleaned_row: list[str] = []
-                                    for col_name, col_type, value in zip(
-                                        spec.columns, column_types, row, strict=True
-                                    ):
-                                        if value == "":
-                                            cleaned_row.append("")
-                                            continue
-                                        if col_type in {"INT8", "FLOAT8", "DATE"}:
-                                            value = value.strip()
-                                        cleaned_row.append(value)
-                                        if "\x00" in value:
-                                            raise ValueError(
-                                                f"{spec.csv_path} row {row_number} col {col_name}: NUL byte not allowed"
-                                            )
-                                        if col_type == "INT8" and not _INT_RE.match(value):
-                                            raise ValueError(
-                                                f"{spec.csv_path} row {row_number} col {col_name}: invalid INT8 value {value!r}"
-                                            )
-                                        if col_type == "FLOAT8" and not _FLOAT_RE.match(value):
-                                            raise ValueError(
-                                                f"{spec.csv_path} row {row_number} col {col_name}: invalid FLOAT8 value {value!r}"
-                                            )
-                                        if col_type == "DATE":
-                                            try:
-                                                cleaned_row[-1] = _normalize_date(value)
-                                            except ValueError as e:
-                                                raise ValueError(
-                                                    f"{spec.csv_path} row {row_number} col {col_name}: {e}"
-                                                ) from e
-
-                                    out_fields: list[str] = []
-                                    for v in cleaned_row:
-                                        if v == "":
-                                            out_fields.append("\\N")
-                                        else:
-                                            out_fields.append(escape_copy_text(v))
-                                    buf.write("\t".join(out_fields))
-                                    buf.write("\n")
-                                    rows_in_chunk += 1
-
-                                    now = time.monotonic()
-                                    if now >= overall_progress_next:
-                                        elapsed = time.time() - t0
-                                        pct = (
-                                            (overall_loaded_rows / overall_known_total) * 100.0
-                                            if overall_known_total
-                                            else None
-                                        )
-                                        run_rows = overall_loaded_rows - baseline_loaded_rows
-                                        eta_s = (
-                                            (
-                                                (overall_known_total - overall_loaded_rows)
-                                                / (run_rows / elapsed)
-                                            )
-                                            if overall_known_total and run_rows and elapsed > 0
-                                            else None
-                                        )
-                                        logger.event(
-                                            "progress",
-                                            table=spec.table,
-                                            table_rows_done=table_committed_rows + rows_in_chunk,
-                                            table_rows_expected=expected,
-                                            overall_rows_done=overall_loaded_rows,
-                                            overall_rows_expected=overall_known_total,
-                                            overall_pct=round(pct, 2) if pct is not None else None,
-                                            eta=_fmt_duration(eta_s) if eta_s is not None else None,
-                                        )
-                                        overall_progress_next = now + args.progress_every_s
-
-                                    if rows_in_chunk >= args.chunk_rows:
-                                        flush()
-
-                                flush()
-
-                            dt = time.time() - table_t0
-                            logger.event("table_done", table=spec.table, seconds=round(dt, 2))
-                            break
-                        except Exception:
-                            conn.rollback()
-                            attempt += 1
-                            logger.event(
-                                "table_error",
-                                table=spec.table,
-                                attempt=attempt,
-                                error_type=type(sys.exc_info()[1]).__name__,
-                                error=str(sys.exc_info()[1]),
                             )
-                            if attempt > args.retries:
-                                raise
-                            # If we retry, clear any committed rows from this table to avoid duplicates.
-                            if table_committed_rows:
-                                try:
-                                    cur.execute(
-                                        sql.SQL("TRUNCATE TABLE {}.{}").format(
-                                            sql.Identifier(args.schema), sql.Identifier(spec.table)
-                                        )
-                                    )
-                                    conn.commit()
-                                except Exception as cleanup_error:
-                                    conn.rollback()
-                                    logger.event(
-                                        "table_retry_cleanup_failed",
-                                        table=spec.table,
-                                        error_type=type(cleanup_error).__name__,
-                                        error=str(cleanup_error),
-                                    )
-                                    raise
-                                overall_loaded_rows -= table_committed_rows
-                                table_committed_rows = 0
-                                logger.event("table_truncate_for_retry", table=spec.table)
-                            time.sleep(args.retry_sleep_s)
+                    conn.commit()
+                    loaded_rows = multiprocessing.Value("q", progress.loaded_rows)
+                    with ProcessPoolExecutor(
+                        max_workers=workers,
+                        initializer=_init_load_worker,
+                        initargs=(loaded_rows,),
+                    ) as pool:
+                        futures = [
+                            pool.submit(
+                                _load_table_in_worker,
+                                database_url,
+                                spec,
+                                args=args,
+                                dictionary_coverage=dictionary_coverage.get(spec.table),
+                                expected=task_expected(spec, segment),
+                                existing=existing_rows_by_table.get(spec.table, 0)
+                                if args.resume
+                                else 0,
+                                segment=segment,
+                                known_total=overall_known_total,
+                                baseline_rows=overall_loaded_rows,
+                                t0=t0,
+                            )
+                            for spec, segment in tasks
+                        ]
+                        for future in as_completed(futures):
+                            future.result()
 
                 if not args.skip_indexes:
                     created_tables = {s.table for s in specs}
-                    if "food" in created_tables:
-                        cur.execute(
-                            sql.SQL(
-                                "CREATE INDEX IF NOT EXISTS food_description_idx ON {}.{} ({})"
-                            ).format(
-                                sql.Identifier(args.schema),
-                                sql.Identifier("food"),
-                                sql.Identifier("description"),
-                            )
-                        )
-                    if "branded_food" in created_tables:
-                        cur.execute(
-                            sql.SQL(
-                                "CREATE INDEX IF NOT EXISTS branded_food_gtin_upc_idx ON {}.{} ({})"
-                            ).format(
-                                sql.Identifier(args.schema),
-                                sql.Identifier("branded_food"),
-                                sql.Identifier("gtin_upc"),
-                            )
-                        )
+                    indexes = [ix for ix in _POST_IMPORT_INDEXES if ix[1] in created_tables]
+                    # The indexes are on different tables, so each builds on its own
+                    # connection; nothing may stay open here for CONCURRENTLY to wait on.
                     conn.commit()
+                    if indexes:
+                        with ThreadPoolExecutor(max_workers=len(indexes)) as pool:
+                            futures = [
+                                pool.submit(
+                                    _create_post_import_index, database_url, args, logger, *ix
+                                )
+                                for ix in indexes
+                            ]
+                            for future in futures:
+                                future.result()
         run_success = True
     except KeyboardInterrupt:
         logger.event("run_interrupted")
@@ -842,25 +1880,23 @@ def main(argv: list[str]) -> int:
             loaded_rows = expected_rows.get(specs[0].table, 0)
 
         bytes_per_s = loaded_bytes / max(elapsed_s, 1e-9)
-        rows_per_s = loaded_rows / max(elapsed_s, 1e-9) if loaded_rows else 0.0
+        lines = [
+            f"Benchmark elapsed: {_fmt_duration(elapsed_s)}",
+            f"Throughput: {bytes_per_s/1024/1024:.2f} MiB/s",
+        ]
+        rows_per_s = loaded_rows / max(elapsed_s, 1e-9)
+        if loaded_rows:
+            lines.append(f"Throughput: {rows_per_s:,.0f} rows/s")
+        else:
+            lines.append("Throughput: (rows/s unavailable)")
         est_by_bytes = bundle_total_bytes / max(bytes_per_s, 1e-9)
-        est_by_rows = bundle_total_rows / max(rows_per_s, 1e-9) if rows_per_s else 0.0
-
-        print(
-            "\n".join(
-                [
-                    f"Benchmark elapsed: {_fmt_duration(elapsed_s)}",
-                    f"Throughput: {bytes_per_s/1024/1024:.2f} MiB/s",
-                    f"Throughput: {rows_per_s:,.0f} rows/s"
-                    if loaded_rows
-                    else "Throughput: (rows/s unavailable)",
-                    f"Extrapolated full import (bytes): {_fmt_duration(est_by_bytes)}",
-                    f"Extrapolated full import (rows): {_fmt_duration(est_by_rows)}"
-                    if bundle_total_rows and rows_per_s
-                    else "Extrapolated full import (rows): (unavailable)",
-                ]
-            )
-        )
+        lines.append(f"Extrapolated full import (bytes): {_fmt_duration(est_by_bytes)}")
+        if bundle_total_rows and loaded_rows:
+            est_by_rows = bundle_total_rows / rows_per_s
+            lines.append(f"Extrapolated full import (rows): {_fmt_duration(est_by_rows)}")
+        else:
+            lines.append("Extrapolated full import (rows): (unavailable)")
+        print("\n".join(lines))
 
     return 0
 
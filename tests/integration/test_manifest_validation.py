@@ -7,7 +7,6 @@ structure and enforces SHA-256/byte-size matching.
 from __future__ import annotations
 
 import json
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -51,60 +50,50 @@ def _manifest_bool(data: dict[str, object], key: str) -> bool | None:
     raise SystemExit(f"Invalid preflight manifest field {key!r} (expected bool)")
 
 
-def test_manifest_valid_structure():
+def test_manifest_valid_structure(tmp_path: Path):
     """Valid manifest should parse successfully."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        manifest_path = Path(f.name)
-        json.dump(
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(
+        json.dumps(
             {
                 "file_sha256": "abc123",
                 "file_bytes": 1234,
                 "duplicates_found": False,
-            },
-            f,
-        )
-
-    try:
-        manifest = _load_preflight_manifest(manifest_path)
-        assert manifest["file_sha256"] == "abc123"
-        assert _manifest_int(manifest, "file_bytes") == 1234
-        assert _manifest_bool(manifest, "duplicates_found") is False
-    finally:
-        manifest_path.unlink()
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    manifest = _load_preflight_manifest(manifest_path)
+    assert manifest["file_sha256"] == "abc123"
+    assert _manifest_int(manifest, "file_bytes") == 1234
+    assert _manifest_bool(manifest, "duplicates_found") is False
 
 
-def test_manifest_missing_file():
+def test_manifest_missing_file(tmp_path: Path):
     """Missing manifest file should raise SystemExit."""
-    manifest_path = Path("/tmp/nonexistent_manifest_12345.json")
+    manifest_path = tmp_path / "missing.json"
 
     with pytest.raises(SystemExit, match="Missing preflight manifest"):
         _load_preflight_manifest(manifest_path)
 
 
-def test_manifest_invalid_json():
+def test_manifest_invalid_json(tmp_path: Path):
     """Invalid JSON should raise SystemExit."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        manifest_path = Path(f.name)
-        f.write("{invalid json")
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text("{invalid json", encoding="utf-8")
 
-    try:
-        with pytest.raises(SystemExit, match="Invalid preflight manifest JSON"):
-            _load_preflight_manifest(manifest_path)
-    finally:
-        manifest_path.unlink()
+    with pytest.raises(SystemExit, match="Invalid preflight manifest JSON"):
+        _load_preflight_manifest(manifest_path)
 
 
-def test_manifest_not_dict():
+def test_manifest_not_dict(tmp_path: Path):
     """Manifest that's not a dict should raise SystemExit."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        manifest_path = Path(f.name)
-        json.dump(["not", "a", "dict"], f)
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(json.dumps(["not", "a", "dict"]), encoding="utf-8")
 
-    try:
-        with pytest.raises(SystemExit, match="expected JSON object"):
-            _load_preflight_manifest(manifest_path)
-    finally:
-        manifest_path.unlink()
+    with pytest.raises(SystemExit, match="expected JSON object"):
+        _load_preflight_manifest(manifest_path)
 
 
 def test_manifest_missing_sha256():
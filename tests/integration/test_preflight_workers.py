@@ -0,0 +1,58 @@
+"""Test that the parallel preflight scan agrees with the serial one.
+
+--workers splits an uncompressed export into byte ranges read by separate processes; the
+manifest must come out the same as a single serial read of the file.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from foodb.sources.openfoodfacts import preflight, ranges
+
+
+def _manifest(tsv: Path, out: Path, workers: int) -> dict[str, object]:
+    assert (
+        preflight.main(
+            ["--tsv-path", str(tsv), "--manifest-out", str(out), "--workers", str(workers)]
+        )
+        == 0
+    )
+    manifest = json.loads(out.read_text(encoding="utf-8"))
+    for key in ("created_at", "sort_seconds"):
+        manifest.pop(key)
+    return manifest
+
+
+def test_parallel_manifest_matches_serial_with_bare_cr(tmp_path: Path):
+    """A bare CR ends a line for the serial reader, so the parallel ranges must split there too."""
+    tsv = tmp_path / "products.tsv"
+    lines = ["code\tproduct_name\n"]
+    for i in range(2000):
+        name = "foo\r9bar" if i % 100 == 0 else f"product {i}"
+        lines.append(f"{i % 1500:08d}\t{name}\n")
+    tsv.write_bytes("".join(lines).encode("utf-8"))
+
+    serial = _manifest(tsv, tmp_path / "serial.json", 1)
+    parallel = _manifest(tsv, tmp_path / "parallel.json", 3)
+
+    assert serial["code_total"] == 2020
+    assert parallel == serial
+
+
+def test_failed_range_removes_its_runs(tmp_path: Path):
+    """Runs spilled before a worker fails never reach the parent, so the worker removes them."""
+    tsv = tmp_path / "products.tsv"
+    body = "".join(f"{i:08d}\tp\n" for i in range(300_000)).encode("utf-8")
+    tsv.write_bytes(b"code\tproduct_name\n" + body + b"\xff\tbad\n")
+    runs_dir = tmp_path / "runs"
+    runs_dir.mkdir()
+    ((start, end),) = ranges.data_ranges(tsv, 1)
+
+    with pytest.raises(UnicodeDecodeError):
+        preflight._count_range((tsv, start, end, "\t", 0, "strict", 1000, runs_dir))
+
+    assert list(runs_dir.iterdir()) == []
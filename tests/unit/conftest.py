@@ -0,0 +1,29 @@
+"""Shared fixtures for the unit tests."""
+
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+
+import pytest
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+
+
+@pytest.fixture(scope="session")
+def bom_tsv_lines() -> list[str]:
+    """Lines of bom_utf8_with_bom.tsv decoded with utf-8-sig (BOM dropped), read once."""
+    with open(FIXTURES / "bom_utf8_with_bom.tsv", encoding="utf-8-sig", newline="") as f:
+        return f.readlines()
+
+
+@pytest.fixture(scope="session")
+def duplicates_scored() -> tuple[dict[str, int], list[list[str]]]:
+    """Rows of duplicates_scored.tsv plus a header name -> index map, parsed once.
+
+    Shared across tests, so tests filter the rows rather than modify them.
+    """
+    with open(FIXTURES / "duplicates_scored.tsv", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f, delimiter="\t")
+        header = next(reader)
+        return {name: i for i, name in enumerate(header)}, list(reader)
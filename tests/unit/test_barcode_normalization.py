@@ -0,0 +1,48 @@
+"""Test barcode normalization (digit filtering)."""
+
+from __future__ import annotations
+
+from foodb.normalize.barcode import (
+    normalize_barcode,
+    normalize_barcode_fast,
+    normalize_barcodes_fast,
+)
+
+
+def test_non_digits_removed():
+    """Separators and letters should be dropped, leading zeros kept."""
+    result = normalize_barcode(" 00-123 45 ")
+    assert result.raw == "00-123 45"
+    assert result.normalized == "0012345"
+    assert result.digits == 7
+
+
+def test_no_digits_normalizes_to_empty():
+    """Codes without any digits should normalize to an empty string."""
+    result = normalize_barcode("n/a")
+    assert result.normalized == ""
+    assert result.digits == 0
+
+
+def test_non_ascii_matches_isdigit_semantics():
+    """Non-ASCII input should keep the str.isdigit() filter behavior."""
+    raw = "１２a3é"  # full-width "12", "a", "3", "é"
+    expected = "".join(ch for ch in raw if ch.isdigit())
+    assert normalize_barcode(raw).normalized == expected
+
+
+def test_fast_path_matches_dataclass():
+    """normalize_barcode_fast should return the same digits as normalize_barcode."""
+    for raw in (" 00-123 45 ", "n/a", "１２a3é", "4006381333931"):
+        assert normalize_barcode_fast(raw) == normalize_barcode(raw).normalized
+
+
+def test_batch_matches_single():
+    """normalize_barcodes_fast should match per-code normalization, in order."""
+    for raws in (
+        [" 00-123 45 ", "n/a", "", "4006381333931"],
+        ["12", "１２a3é", "7"],
+        ["1\n2", "34"],
+        [],
+    ):
+        assert normalize_barcodes_fast(raws) == [normalize_barcode_fast(raw) for raw in raws]
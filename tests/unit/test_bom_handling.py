@@ -5,76 +5,81 @@ from __future__ import annotations
 import csv
 from pathlib import Path
 
+import pytest
+
+from foodb.sources.openfoodfacts import ingest_tsv, preflight
+
 # Test that BOM is stripped and first column is recognized correctly
 
 
-def test_bom_stripped_from_header():
+def test_bom_stripped_from_header(bom_tsv_lines: list[str]):
     """UTF-8 BOM at start of file should be stripped from header line."""
     fixture = Path(__file__).parent.parent / "fixtures" / "bom_utf8_with_bom.tsv"
     assert fixture.exists(), f"Missing fixture: {fixture}"
 
-    with open(fixture, encoding="utf-8", newline="") as f:
-        header_line = f.readline()
+    # BOM should be present in the raw bytes
+    assert fixture.read_bytes().startswith(b"\xef\xbb\xbf"), "Expected BOM at start of file"
 
-        # BOM should be present as unicode character
-        assert header_line.startswith("\ufeff"), "Expected BOM at start of file"
+    # The fixture is decoded with utf-8-sig, which drops the BOM as the implementation does
+    header_line = bom_tsv_lines[0]
 
-        # Strip BOM as implementation does
-        header_line = header_line.lstrip("\ufeff")
+    # Parse header
+    reader = csv.DictReader([header_line], delimiter="\t")
+    fieldnames = reader.fieldnames
 
-        # Parse header
-        reader = csv.DictReader([header_line], delimiter="\t")
-        fieldnames = reader.fieldnames
-
-        # First column should be "code", not "\ufeffcode"
-        assert fieldnames is not None
-        assert fieldnames[0] == "code", f"Expected 'code', got {fieldnames[0]!r}"
-        assert "product_name" in fieldnames
-        assert "last_modified_t" in fieldnames
+    # First column should be "code", not "\ufeffcode"
+    assert fieldnames is not None
+    assert fieldnames[0] == "code", f"Expected 'code', got {fieldnames[0]!r}"
+    assert "product_name" in fieldnames
+    assert "last_modified_t" in fieldnames
 
 
-def test_bom_allows_row_parsing():
+def test_bom_allows_row_parsing(bom_tsv_lines: list[str]):
     """Rows should parse correctly after BOM is stripped from header."""
-    fixture = Path(__file__).parent.parent / "fixtures" / "bom_utf8_with_bom.tsv"
+    header_line, *data_lines = bom_tsv_lines
 
-    with open(fixture, encoding="utf-8", newline="") as f:
-        header_line = f.readline()
+    # Parse rows using the codec-stripped header
+    reader = csv.DictReader(
+        data_lines, fieldnames=header_line.rstrip("\n").split("\t"), delimiter="\t"
+    )
 
-        # Strip BOM
-        if header_line.startswith("\ufeff"):
-            header_line = header_line.lstrip("\ufeff")
+    rows = list(reader)
+    assert len(rows) == 2, f"Expected 2 rows, got {len(rows)}"
 
-        # Parse rows using corrected header
-        reader = csv.DictReader(f, fieldnames=header_line.rstrip("\n").split("\t"), delimiter="\t")
+    # Verify first row
+    assert rows[0]["code"] == "0012345"
+    assert rows[0]["product_name"] == "Test Product A"
+    assert rows[0]["energy-kcal_100g"] == "100"
 
-        rows = list(reader)
-        assert len(rows) == 2, f"Expected 2 rows, got {len(rows)}"
-
-        # Verify first row
-        assert rows[0]["code"] == "0012345"
-        assert rows[0]["product_name"] == "Test Product A"
-        assert rows[0]["energy-kcal_100g"] == "100"
-
-        # Verify second row
-        assert rows[1]["code"] == "0067890"
-        assert rows[1]["product_name"] == "Test Product B"
+    # Verify second row
+    assert rows[1]["code"] == "0067890"
+    assert rows[1]["product_name"] == "Test Product B"
 
 
 def test_no_bom_works_normally():
     """Files without BOM should parse normally."""
     fixture = Path(__file__).parent.parent / "fixtures" / "bom_utf8.tsv"
 
-    with open(fixture, encoding="utf-8", newline="") as f:
+    # utf-8-sig is a no-op when there is no BOM
+    with open(fixture, encoding="utf-8-sig", newline="") as f:
         header_line = f.readline()
 
-        # No BOM expected
-        assert not header_line.startswith("\ufeff")
-
-        # Strip BOM anyway (no-op)
-        header_line = header_line.lstrip("\ufeff")
-
         reader = csv.DictReader([header_line], delimiter="\t")
         fieldnames = reader.fieldnames
 
         assert fieldnames is not None
         assert fieldnames[0] == "code"
+
+
+def test_only_one_bom_stripped(tmp_path: Path):
+    """Only one leading BOM is stripped, so a doubled BOM leaves the code column unrecognized."""
+    tsv = tmp_path / "double_bom.tsv"
+    tsv.write_bytes(b"\xef\xbb\xbf\xef\xbb\xbfcode\tproduct_name\n0012345\tA\n")
+
+    with ingest_tsv._open_input(tsv, encoding_errors="strict") as f:
+        assert f.readline() == "\ufeffcode\tproduct_name\n"
+    with preflight._open_hashed(tsv, encoding_errors="strict") as (f, _hashing):
+        assert f.readline() == "\ufeffcode\tproduct_name\n"
+
+    with pytest.raises(SystemExit, match="missing required column: code"):
+        preflight.main(["--tsv-path", str(tsv), "--manifest-out", str(tmp_path / "m.json")])
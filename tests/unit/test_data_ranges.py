@@ -0,0 +1,54 @@
+"""Test that the --workers byte ranges yield the same rows as the serial reader."""
+
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+
+import pytest
+
+from foodb.sources.openfoodfacts.ingest_tsv import _open_input
+from foodb.sources.openfoodfacts.ranges import data_ranges, read_range
+
+
+def _serial_rows(path: Path) -> list[list[str]]:
+    with _open_input(path, encoding_errors="strict") as f:
+        f.readline()
+        return list(csv.reader(f, delimiter="\t"))
+
+
+def _range_rows(path: Path, parts: int) -> list[list[str]]:
+    rows: list[list[str]] = []
+    for start, end in data_ranges(path, parts):
+        rows.extend(
+            csv.reader(read_range(path, start, end, encoding_errors="strict"), delimiter="\t")
+        )
+    return rows
+
+
+@pytest.mark.parametrize("parts", [1, 2, 3, 7])
+@pytest.mark.parametrize(
+    "text",
+    [
+        "code\tname\n1\ta\n2\tb\n3\tc\n4\td\n5\te\n",
+        "code\tname\r\n1\ta\r\n2\tb\r\n3\tc\r\n4\td",
+        "code\tname\n1\tfoo\r9bar\n2\tb\n3\tx\ry\rz\n4\t\r\n5\te\r",
+        "code\tname\r1\ta\n2\tb\n3\tc\n",
+        "\ufeffcode\tname\n1\tcafé\n2\tb\n",
+    ],
+)
+def test_range_rows_match_serial_reader(tmp_path: Path, text: str, parts: int):
+    """Bare CRs, CRLFs and a missing final newline split rows the same way in both readers."""
+    path = tmp_path / "products.tsv"
+    path.write_bytes(text.encode("utf-8"))
+
+    assert _range_rows(path, parts) == _serial_rows(path)
+
+
+@pytest.mark.parametrize("parts", [1, 4])
+def test_header_only_file_has_no_ranges(tmp_path: Path, parts: int):
+    """A header-only export yields no ranges, so no worker pool is started for it."""
+    path = tmp_path / "products.tsv"
+    path.write_text("code\tname\n", encoding="utf-8")
+
+    assert data_ranges(path, parts) == []
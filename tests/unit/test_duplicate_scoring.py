@@ -8,54 +8,50 @@ Higher score wins. Tuple comparison is lexicographic.
 
 from __future__ import annotations
 
-import csv
-from pathlib import Path
 
-
-def test_duplicate_scoring_fixture_structure():
+def test_duplicate_scoring_fixture_structure(
+    duplicates_scored: tuple[dict[str, int], list[list[str]]],
+):
     """Verify the duplicates_scored.tsv fixture has expected structure."""
-    fixture = Path(__file__).parent.parent / "fixtures" / "duplicates_scored.tsv"
-
-    with open(fixture, encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f, delimiter="\t")
-        rows = list(reader)
+    idx, rows = duplicates_scored
+    code_i = idx["code"]
 
     # Should have 4 rows: 3 duplicates for code 0012345, 1 unique for 0067890
     assert len(rows) == 4
 
     # First three rows should have same code
-    assert rows[0]["code"] == "0012345"
-    assert rows[1]["code"] == "0012345"
-    assert rows[2]["code"] == "0012345"
+    assert rows[0][code_i] == "0012345"
+    assert rows[1][code_i] == "0012345"
+    assert rows[2][code_i] == "0012345"
 
     # Fourth row should be unique
-    assert rows[3]["code"] == "0067890"
+    assert rows[3][code_i] == "0067890"
 
 
-def test_duplicate_scoring_last_modified_wins():
+def test_duplicate_scoring_last_modified_wins(
+    duplicates_scored: tuple[dict[str, int], list[list[str]]],
+):
     """Newer last_modified_t should win if other factors equal."""
-    fixture = Path(__file__).parent.parent / "fixtures" / "duplicates_scored.tsv"
-
-    with open(fixture, encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f, delimiter="\t")
-        rows = [r for r in reader if r["code"] == "0012345"]
+    idx, rows = duplicates_scored
+    rows = [r for r in rows if r[idx["code"]] == "0012345"]
 
     # Row 0: last_modified_t=1704067200 (older)
     # Row 1: last_modified_t=1704153600 (newer)
     # Row 2: last_modified_t=1704153600 (newer, same as row 1)
 
-    row0_ts = int(rows[0]["last_modified_t"])
-    row1_ts = int(rows[1]["last_modified_t"])
-    row2_ts = int(rows[2]["last_modified_t"])
+    ts_i = idx["last_modified_t"]
+    row0_ts = int(rows[0][ts_i])
+    row1_ts = int(rows[1][ts_i])
+    row2_ts = int(rows[2][ts_i])
 
     assert row0_ts < row1_ts, "Row 0 should be older than row 1"
     assert row1_ts == row2_ts, "Row 1 and 2 should have same timestamp"
 
 
-def test_duplicate_scoring_nutrient_count():
+def test_duplicate_scoring_nutrient_count(
+    duplicates_scored: tuple[dict[str, int], list[list[str]]],
+):
     """More nutrients should win if last_modified_t is equal."""
-    fixture = Path(__file__).parent.parent / "fixtures" / "duplicates_scored.tsv"
-
     nutrient_fields = [
         "energy-kcal_100g",
         "fat_100g",
@@ -64,12 +60,13 @@ def test_duplicate_scoring_nutrient_count():
         "sugars_100g",
     ]
 
-    with open(fixture, encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f, delimiter="\t")
-        rows = [r for r in reader if r["code"] == "0012345"]
+    idx, rows = duplicates_scored
+    rows = [r for r in rows if r[idx["code"]] == "0012345"]
+
+    nutrient_idx = [idx[k] for k in nutrient_fields]
 
-    def count_nutrients(row: dict[str, str]) -> int:
-        return sum(1 for k in nutrient_fields if row.get(k, "").strip() != "")
+    def count_nutrients(row: list[str]) -> int:
+        return sum(1 for i in nutrient_idx if row[i].strip())
 
     # Row 0: 2 nutrients (energy, fat)
     # Row 1: 2 nutrients (energy, fat)
@@ -82,19 +79,20 @@ def test_duplicate_scoring_nutrient_count():
     # Row 2 should win due to more nutrients (same timestamp as row 1)
 
 
-def test_duplicate_scoring_product_fields():
+def test_duplicate_scoring_product_fields(
+    duplicates_scored: tuple[dict[str, int], list[list[str]]],
+):
     """More non-empty product fields should win if nutrients equal."""
-    fixture = Path(__file__).parent.parent / "fixtures" / "duplicates_scored.tsv"
-
     # Product fields checked by implementation (example subset)
     product_score_fields = ["product_name", "brands", "categories", "quantity"]
 
-    with open(fixture, encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f, delimiter="\t")
-        rows = [r for r in reader if r["code"] == "0012345"]
+    idx, rows = duplicates_scored
+    rows = [r for r in rows if r[idx["code"]] == "0012345"]
+
+    product_idx = [idx[k] for k in product_score_fields]
 
-    def count_product_fields(row: dict[str, str]) -> int:
-        return sum(1 for k in product_score_fields if row.get(k, "").strip() != "")
+    def count_product_fields(row: list[str]) -> int:
+        return sum(1 for i in product_idx if row[i].strip())
 
     # Row 0: product_name, brands (2 fields)
     # Row 1: product_name, brands (2 fields)
@@ -105,10 +103,10 @@ def test_duplicate_scoring_product_fields():
     assert count_product_fields(rows[2]) == 4
 
 
-def test_duplicate_scoring_best_row_identification():
+def test_duplicate_scoring_best_row_identification(
+    duplicates_scored: tuple[dict[str, int], list[list[str]]],
+):
     """The complete scoring logic should identify row 2 as best."""
-    fixture = Path(__file__).parent.parent / "fixtures" / "duplicates_scored.tsv"
-
     nutrient_fields = [
         "energy-kcal_100g",
         "fat_100g",
@@ -118,14 +116,17 @@ def test_duplicate_scoring_best_row_identification():
     ]
     product_score_fields = ["product_name", "brands", "categories", "quantity"]
 
-    with open(fixture, encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f, delimiter="\t")
-        rows = [r for r in reader if r["code"] == "0012345"]
+    idx, rows = duplicates_scored
+    rows = [r for r in rows if r[idx["code"]] == "0012345"]
+
+    ts_i = idx["last_modified_t"]
+    nutrient_idx = [idx[k] for k in nutrient_fields]
+    product_idx = [idx[k] for k in product_score_fields]
 
-    def compute_score(row: dict[str, str]) -> tuple[int, int, int]:
-        last_modified = int(row["last_modified_t"]) if row["last_modified_t"] else -1
-        nutrient_count = sum(1 for k in nutrient_fields if row.get(k, "").strip() != "")
-        product_nonempty = sum(1 for k in product_score_fields if row.get(k, "").strip() != "")
+    def compute_score(row: list[str]) -> tuple[int, int, int]:
+        last_modified = int(row[ts_i]) if row[ts_i] else -1
+        nutrient_count = sum(1 for i in nutrient_idx if row[i].strip())
+        product_nonempty = sum(1 for i in product_idx if row[i].strip())
         return (last_modified, nutrient_count, product_nonempty)
 
     scores = [compute_score(r) for r in rows]
@@ -143,4 +144,4 @@ def test_duplicate_scoring_best_row_identification():
     assert best_idx == 2
 
     # Verify the best row is "Newer Complete"
-    assert rows[best_idx]["product_name"] == "Newer Complete"
+    assert rows[best_idx][idx["product_name"]] == "Newer Complete"
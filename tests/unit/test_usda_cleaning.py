@@ -0,0 +1,55 @@
+"""Test the USDA importer's cell cleaning for values COPY would reject."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from scripts import import_usda_fdc
+
+
+@pytest.mark.parametrize(
+    ("col_type", "value", "message"),
+    [
+        ("INT8", "٣", "invalid INT8 value '٣'"),
+        ("INT8", "１２", "invalid INT8 value '１２'"),
+        ("FLOAT8", "1.٥", "invalid FLOAT8 value '1.٥'"),
+        ("INT8", "9223372036854775808", "INT8 value out of range '9223372036854775808'"),
+        ("INT8", "-9223372036854775809", "INT8 value out of range '-9223372036854775809'"),
+        ("DATE", "2020-13-45", "invalid DATE value '2020-13-45'"),
+        ("DATE", "2/30/2021", "invalid DATE value '2/30/2021'"),
+    ],
+)
+def test_bad_cell_names_row_and_column(col_type: str, value: str, message: str):
+    """The column fast path declines the chunk, and the row path names the bad cell."""
+    column_types = ["INT8", col_type]
+    assert import_usda_fdc._clean_columns([["1", "2"], ["", value]], column_types) is None
+
+    with pytest.raises(ValueError, match=f"food.csv row 3 col amount: {message}"):
+        import_usda_fdc._clean_rows(
+            Path("food.csv"),
+            [["1", ""], ["2", value]],
+            ["id", "amount"],
+            column_types,
+            first_row_number=2,
+        )
+
+
+@pytest.mark.parametrize(
+    ("col_type", "value", "cleaned"),
+    [
+        ("INT8", "9223372036854775807", "9223372036854775807"),
+        ("INT8", "-9223372036854775808", "-9223372036854775808"),
+        ("DATE", "2020-02-29", "2020-02-29"),
+        ("DATE", "2/29/2020", "2020-02-29"),
+    ],
+)
+def test_boundary_cells_are_kept(col_type: str, value: str, cleaned: str):
+    """INT8 limits and real dates pass both cleaning paths."""
+    rows = import_usda_fdc._clean_rows(
+        Path("food.csv"), [[value]], ["value"], [col_type], first_row_number=2
+    )
+    assert rows == [[cleaned]]
+    columns = import_usda_fdc._clean_columns([[value]], [col_type])
+    assert columns in (None, [[cleaned]])
@@ -0,0 +1,64 @@
+"""Test the USDA importer's CSV line index and row count against csv.reader."""
+
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+
+import pytest
+
+from scripts import import_usda_fdc
+
+
+def _reader_rows_from_seek(path: Path, row: int) -> list[list[str]]:
+    """Rows csv.reader yields when resuming at data row `row` via the line index."""
+    with path.open("rb") as f:
+        skip = import_usda_fdc._seek_data_row(f, path, row)
+        data = f.read().decode("utf-8")
+    reader = csv.reader(data.splitlines(keepends=True))
+    if skip is None:
+        skip = 1 + row
+    return list(reader)[skip:]
+
+
+def test_line_index_follows_quoted_newlines(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Newlines inside quoted fields don't start records."""
+    monkeypatch.setattr(import_usda_fdc, "_LINE_INDEX_STRIDE", 2)
+    path = tmp_path / "food.csv"
+    path.write_text('id,desc\n1,"a\nb"\n2,"say ""hi"""\n3,c\n4,"d,\n"\n5,e\n', encoding="utf-8")
+
+    assert len(import_usda_fdc._csv_line_index(path)) == 3
+    assert _reader_rows_from_seek(path, 3) == [["4", "d,\n"], ["5", "e"]]
+
+
+def test_line_index_stray_quote_in_unquoted_field(tmp_path: Path):
+    """A quote inside an unquoted field is literal to csv.reader, so no rows are skipped."""
+    rows = [[str(i), f'size {i}"' if i % 10 == 0 else "x"] for i in range(1, 40)]
+    path = tmp_path / "food.csv"
+    with path.open("w", encoding="utf-8", newline="") as f:
+        f.write("id,desc\n")
+        f.writelines(f"{i},{desc}\n" for i, desc in rows)
+
+    with path.open(encoding="utf-8", newline="") as f:
+        assert list(csv.reader(f))[1:] == rows
+    assert len(import_usda_fdc._csv_line_index(path)) == 0
+    assert _reader_rows_from_seek(path, 15) == rows[15:]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        'id,desc\n1,12"\n2,ok\n3,9"\n',
+        'id,desc\n1,size 12"\n2,size 10"\n3,x\n',
+        'id,desc\n1,"a\nb"\n2,"say ""hi"""\n3,c',
+        'id,desc\n1,a""b\n2,"x"y"\n3,z\n',
+    ],
+)
+def test_data_row_count_matches_csv_reader(tmp_path: Path, text: str):
+    """Quotes inside unquoted fields don't change the data row count."""
+    path = tmp_path / "food.csv"
+    path.write_text(text, encoding="utf-8")
+
+    with path.open(encoding="utf-8", newline="") as f:
+        expected = sum(1 for _ in csv.reader(f)) - 1
+    assert import_usda_fdc._count_csv_data_rows(path) == expected